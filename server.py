@@ -15,8 +15,9 @@ development tools. It enables:
 - Raw TCL: Execute arbitrary TCL commands for advanced operations
 
 Architecture:
-    The server maintains a singleton VivadoSession that keeps Vivado running
-    in TCL mode. Commands are sent via pexpect and results are parsed and
+    The server keeps persistent VivadoSessions running Vivado in TCL mode: a
+    default session, plus one per project for calls that pass a "project"
+    argument. Commands are sent via pexpect and results are parsed and
     returned as structured JSON. This avoids the ~30 second startup time
     for each Vivado command.
 
@@ -44,17 +45,32 @@ Author: Created with Claude (Anthropic)
 License: MIT
 """
 
+import asyncio
+import fnmatch
 import json
 import os
 import re
 import uuid
+from collections import defaultdict, deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
+from typing import Optional
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from .vivado_session import get_session, VivadoSession
+from .vivado_session import (
+    get_dedicated_session, get_session, is_pooled_session, reset_session,
+    tcl_brace, VivadoSession,
+)
+
+# orjson is optional; it pretty-prints JSON several times faster than the
+# standard library, which matters for large responses (reports, cell lists)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # =============================================================================
@@ -68,6 +84,15 @@ FEATURE_REQUESTS_FILE = Path(__file__).parent / "data" / "feature_requests.json"
 # Reports are written to temp files when they exceed inline size limits
 REPORTS_DIR = Path("/tmp/vivado_mcp")
 
+# Schema for the optional "project" argument accepted by every tool that
+# talks to Vivado. Calls with a project are routed to that project's own
+# session, so unrelated projects don't wait on each other.
+PROJECT_ARGUMENT = {
+    "type": "string",
+    "description": "Project path (.xpr) whose dedicated Vivado session should run this "
+                   "tool (default: the shared session)"
+}
+
 # Maximum characters to return inline in a response
 # Larger reports should use generate_full_report + read_report_section
 MAX_RESPONSE_CHARS = 8000  # ~8KB limit for inline responses
@@ -79,6 +104,32 @@ REPORT_CACHE_HOURS = 1
 # This allows quick lookup of previously generated reports
 _report_cache: dict[str, dict] = {}
 
+# ID for the next feature request. Read from the file on first use, then
+# counted in memory so each submission doesn't have to re-read the file.
+_next_feature_request_id: Optional[int] = None
+
+
+# =============================================================================
+# JSON SERIALIZATION
+# =============================================================================
+
+def dumps_json(obj) -> str:
+    """
+    Serialize an object to indented JSON text.
+
+    Every tool response goes through this function. Uses orjson when it is
+    installed and falls back to the standard json module otherwise.
+
+    Args:
+        obj: JSON-serializable object (dicts, lists, strings, numbers, ...)
+
+    Returns:
+        JSON string indented by 2 spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 
 # =============================================================================
 # FEATURE REQUEST MANAGEMENT
@@ -104,6 +155,26 @@ def load_feature_requests() -> list[dict]:
     return []
 
 
+def next_feature_request_id() -> int:
+    """
+    Allocate the ID for a new feature request.
+
+    The first call scans the stored requests for the highest ID; later calls
+    just increment an in-memory counter.
+
+    Returns:
+        The next unused sequential ID (starting at 1)
+    """
+    global _next_feature_request_id
+    if _next_feature_request_id is None:
+        _next_feature_request_id = max(
+            (r.get("id", 0) for r in load_feature_requests()), default=0
+        ) + 1
+    request_id = _next_feature_request_id
+    _next_feature_request_id += 1
+    return request_id
+
+
 def save_feature_request(request: dict) -> None:
     """
     Save a feature request to the persistent JSON file.
@@ -122,7 +193,7 @@ def save_feature_request(request: dict) -> None:
     requests.append(request)
     # Ensure the data directory exists
     FEATURE_REQUESTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    FEATURE_REQUESTS_FILE.write_text(json.dumps(requests, indent=2))
+    FEATURE_REQUESTS_FILE.write_text(dumps_json(requests))
 
 
 # =============================================================================
@@ -207,8 +278,11 @@ def verify_run_status(session, run_name: str) -> dict:
         - actually_succeeded: True if run completed successfully
         - actually_failed: True if run failed
     """
-    status_result = session.run_tcl(f"get_property STATUS [get_runs {run_name}]")
-    progress_result = session.run_tcl(f"get_property PROGRESS [get_runs {run_name}]")
+    # Both properties in one round trip
+    status_result, progress_result = session.run_tcl_batch([
+        f"get_property STATUS [get_runs {run_name}]",
+        f"get_property PROGRESS [get_runs {run_name}]",
+    ])
 
     status = status_result.output.strip() if status_result.success else "unknown"
     progress = progress_result.output.strip() if progress_result.success else "unknown"
@@ -274,6 +348,82 @@ def generate_report_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
+def count_lines(f) -> int:
+    """
+    Count the lines remaining in a binary file object.
+
+    Reads in 1MB chunks and counts newlines with bytes.count, which runs in
+    C, rather than iterating line objects in Python. A final line without a
+    trailing newline is counted too, matching line iteration.
+
+    Args:
+        f: File object opened in binary mode, counted from its current position
+
+    Returns:
+        Number of lines from the current position to the end of the file
+    """
+    count = 0
+    last = b"\n"
+    while chunk := f.read(1 << 20):
+        count += chunk.count(b"\n")
+        last = chunk[-1:]
+    return count + (last != b"\n")
+
+
+def read_report_lines(file_path: Path, start_line: int, num_lines: int,
+                      search_pattern: str = None,
+                      total_lines: int = None) -> tuple[list[str], int, int, Optional[int]]:
+    """
+    Read a window of lines from a report file without loading the whole file.
+
+    Reports can be tens of megabytes, but callers only ever want a small
+    window. The file is streamed once in binary mode: lines outside the window
+    are counted but never kept or decoded. Vivado reports are ASCII, so the
+    search pattern is matched against raw bytes and only the returned lines
+    are decoded.
+
+    Args:
+        file_path: Report file to read
+        start_line: Line number to start from (1-indexed). Ignored when
+            search_pattern is given.
+        num_lines: Number of lines to return
+        search_pattern: Optional regex (case-insensitive). If given, the window
+            is placed around the first matching line, with a quarter of the
+            window before the match.
+        total_lines: Known line count of the file (e.g., from _report_cache).
+            If given, reading stops after the window instead of counting the
+            rest of the file.
+
+    Returns:
+        Tuple of (lines, start_idx, total_lines, match_idx) where start_idx is
+        the 0-indexed position of the first returned line and match_idx is the
+        0-indexed line of the first search match (None if search_pattern was
+        not given or did not match).
+    """
+    with open(file_path, 'rb') as f:
+        if search_pattern:
+            pattern = re.compile(search_pattern.encode(), re.IGNORECASE)
+            # Rolling window of the lines preceding the current one
+            before = deque(maxlen=num_lines // 4)
+            i = -1
+            for i, line in enumerate(f):
+                if pattern.search(line):
+                    start_idx = i - len(before)
+                    lines = [*before, line, *islice(f, max(0, num_lines - len(before) - 1))]
+                    if total_lines is None:
+                        total_lines = start_idx + len(lines) + count_lines(f)
+                    return [l.decode('utf-8', 'replace') for l in lines], start_idx, total_lines, i
+                before.append(line)
+            return [], 0, i + 1, None
+
+        start_idx = max(0, start_line - 1)
+        skipped = sum(1 for _ in islice(f, start_idx))
+        lines = list(islice(f, num_lines))
+        if total_lines is None:
+            total_lines = skipped + len(lines) + count_lines(f)
+        return [l.decode('utf-8', 'replace') for l in lines], start_idx, total_lines, None
+
+
 def get_hierarchy_depth(path: str) -> int:
     """
     Get the depth of a hierarchical path.
@@ -290,6 +440,83 @@ def get_hierarchy_depth(path: str) -> int:
     return path.count('/')
 
 
+def build_hierarchy_tree(cells: list[str]) -> dict:
+    """
+    Build a nested tree from hierarchical cell paths.
+
+    For example, ["cpu", "cpu/alu", "cpu/alu/adder", "mem"] becomes
+    {"cpu": {"alu": {"adder": {}}}, "mem": {}}.
+
+    Args:
+        cells: Hierarchical cell paths ("/"-separated)
+
+    Returns:
+        Nested dictionary with one level per hierarchy level
+    """
+    def node():
+        return defaultdict(node)
+
+    tree = node()
+    for cell in cells:
+        current = tree
+        for part in cell.split('/'):
+            current = current[part]
+    return tree
+
+
+def index_hierarchical_cells(cells: list[str]) -> dict:
+    """
+    Index a full "get_cells -hierarchical *" listing for local pattern matching.
+
+    With -hierarchical, Vivado matches the pattern against each cell's name
+    relative to its parent, not the full path. The parent is the longest
+    "/"-prefix that is itself a cell in the listing; anything else (e.g.,
+    flattened names like "u_cpu/alu_reg") is part of the cell's own name.
+
+    Args:
+        cells: Every hierarchical cell in the design
+
+    Returns:
+        Dictionary with "cells" and the matching list of "local_names"
+    """
+    cell_set = set(cells)
+    local_names = []
+    for cell in cells:
+        local = cell
+        sep = cell.rfind('/')
+        while sep > 0:
+            if cell[:sep] in cell_set:
+                local = cell[sep + 1:]
+                break
+            sep = cell.rfind('/', 0, sep)
+        local_names.append(local)
+    return {"cells": cells, "local_names": local_names}
+
+
+def match_hierarchical_cells(index: dict, pattern: str) -> Optional[list[str]]:
+    """
+    Evaluate "get_cells -hierarchical <pattern>" against a cached index.
+
+    Only plain * / ? globs on a cell's own name are evaluated locally.
+    Patterns containing "/" (e.g. "core/alu/*") are left to Vivado, since
+    how -hierarchical matches them against nested paths isn't reproduced
+    here; bracket expressions and backslash escapes don't map cleanly onto
+    Python's fnmatch.
+
+    Args:
+        index: Result of index_hierarchical_cells()
+        pattern: The get_cells pattern
+
+    Returns:
+        Matching cells in Vivado's order, or None if the pattern must be
+        run in Vivado instead
+    """
+    if '/' in pattern or '[' in pattern or '\\' in pattern:
+        return None
+    match = re.compile(fnmatch.translate(pattern)).match
+    return [cell for cell, local in zip(index["cells"], index["local_names"]) if match(local)]
+
+
 # =============================================================================
 # MCP SERVER INSTANCE
 # =============================================================================
@@ -305,6 +532,48 @@ server = Server("vivado")
 # These functions parse Vivado's text-based reports into structured data
 # that's easier for AI assistants to work with.
 
+# Patterns are compiled once at import since the parsers run on every call
+
+# Timing summary metrics, e.g. "WNS(ns)      :  1.234"
+_TIMING_SUMMARY_PATTERNS = {
+    key: re.compile(rf"{label}\(ns\)\s*:\s*([-\d.]+)")
+    for key, label in (("wns", "WNS"), ("tns", "TNS"), ("whs", "WHS"), ("ths", "THS"))
+}
+_FAILING_ENDPOINTS_RE = re.compile(r"(\d+)\s+failing\s+endpoint", re.IGNORECASE)
+
+# Utilization table rows: "Resource | Used | Fixed | Available | Util%"
+# Different device families use slightly different names
+_UTILIZATION_PATTERNS = {
+    "lut": re.compile(r"(?:Slice LUTs|CLB LUTs)\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)", re.IGNORECASE),
+    "ff": re.compile(r"(?:Slice Registers|CLB Registers)\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)", re.IGNORECASE),
+    "bram": re.compile(r"Block RAM Tile\s*\|\s*(\d+\.?\d*)\s*\|\s*\d+\s*\|\s*(\d+\.?\d*)\s*\|\s*([\d.]+)", re.IGNORECASE),
+    "dsp": re.compile(r"DSPs?\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)", re.IGNORECASE),
+    "io": re.compile(r"(?:Bonded IOB|Bonded User I/O)\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)", re.IGNORECASE),
+}
+
+# Non-word runs in utilization table headers ("Total LUTs" -> "total_luts")
+_COLUMN_NAME_RE = re.compile(r"\W+")
+
+# Message severity prefix, matched once per line
+_MESSAGE_SEVERITY_RE = re.compile(r"(ERROR|CRITICAL WARNING|WARNING|INFO):")
+_MESSAGE_CATEGORIES = {
+    "ERROR": "errors",
+    "CRITICAL WARNING": "critical_warnings",
+    "WARNING": "warnings",
+    "INFO": "info",
+}
+
+# Timing path report fields
+_PATH_SPLIT_RE = re.compile(r'\n(?=Slack\s*(?:\([A-Z]+\))?\s*:)')
+_PATH_SLACK_RE = re.compile(r'Slack\s*(?:\([A-Z]+\))?\s*:\s*([-\d.]+)\s*ns')
+_PATH_SOURCE_RE = re.compile(r'Source:\s*(\S+)')
+_PATH_DESTINATION_RE = re.compile(r'Destination:\s*(\S+)')
+_PATH_SOURCE_CLOCK_RE = re.compile(r'Source Clock:\s*(\S+)')
+_PATH_DEST_CLOCK_RE = re.compile(r'Destination Clock:\s*(\S+)')
+_PATH_REQUIREMENT_RE = re.compile(r'Requirement:\s*([-\d.]+)\s*ns')
+_PATH_DATA_DELAY_RE = re.compile(r'Data Path Delay:\s*([-\d.]+)\s*ns')
+_PATH_LOGIC_LEVELS_RE = re.compile(r'Logic Levels:\s*(\d+)')
+
 def parse_timing_summary(output: str) -> dict:
     """
     Parse a Vivado timing summary report into structured data.
@@ -339,25 +608,15 @@ def parse_timing_summary(output: str) -> dict:
         "raw": output  # Keep raw output for detailed analysis
     }
 
-    # Parse WNS/TNS (setup timing) using regex
+    # Parse WNS/TNS (setup timing) and WHS/THS (hold timing)
     # Format: "WNS(ns)      :  1.234" or similar
-    wns_match = re.search(r"WNS\(ns\)\s*:\s*([-\d.]+)", output)
-    tns_match = re.search(r"TNS\(ns\)\s*:\s*([-\d.]+)", output)
-    if wns_match:
-        result["wns"] = float(wns_match.group(1))
-    if tns_match:
-        result["tns"] = float(tns_match.group(1))
-
-    # Parse WHS/THS (hold timing)
-    whs_match = re.search(r"WHS\(ns\)\s*:\s*([-\d.]+)", output)
-    ths_match = re.search(r"THS\(ns\)\s*:\s*([-\d.]+)", output)
-    if whs_match:
-        result["whs"] = float(whs_match.group(1))
-    if ths_match:
-        result["ths"] = float(ths_match.group(1))
+    for key, pattern in _TIMING_SUMMARY_PATTERNS.items():
+        match = pattern.search(output)
+        if match:
+            result[key] = float(match.group(1))
 
     # Parse count of failing endpoints
-    fail_match = re.search(r"(\d+)\s+failing\s+endpoint", output, re.IGNORECASE)
+    fail_match = _FAILING_ENDPOINTS_RE.search(output)
     if fail_match:
         result["failing_endpoints"] = int(fail_match.group(1))
 
@@ -401,20 +660,9 @@ def parse_utilization(output: str) -> dict:
         "raw": output  # Keep raw output for detailed analysis
     }
 
-    # Regex patterns for each resource type
-    # Vivado's table format: "Resource | Used | Fixed | Available | Util%"
-    # Different device families use slightly different names
-    patterns = {
-        "lut": r"(?:Slice LUTs|CLB LUTs)\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)",
-        "ff": r"(?:Slice Registers|CLB Registers)\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)",
-        "bram": r"Block RAM Tile\s*\|\s*(\d+\.?\d*)\s*\|\s*\d+\s*\|\s*(\d+\.?\d*)\s*\|\s*([\d.]+)",
-        "dsp": r"DSPs?\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)",
-        "io": r"(?:Bonded IOB|Bonded User I/O)\s*\|\s*(\d+)\s*\|\s*\d+\s*\|\s*(\d+)\s*\|\s*([\d.]+)"
-    }
-
-    # Apply each pattern and extract values
-    for resource, pattern in patterns.items():
-        match = re.search(pattern, output, re.IGNORECASE)
+    # Apply each resource pattern and extract values
+    for resource, pattern in _UTILIZATION_PATTERNS.items():
+        match = pattern.search(output)
         if match:
             result[resource]["used"] = float(match.group(1))
             result[resource]["available"] = float(match.group(2))
@@ -423,6 +671,56 @@ def parse_utilization(output: str) -> dict:
     return result
 
 
+def parse_hierarchical_utilization(output: str) -> list[dict]:
+    """
+    Parse the per-instance table from a hierarchical utilization report.
+
+    report_utilization -hierarchical prints one table row per instance:
+    "| Instance | Module | Total LUTs | Logic LUTs | ... |". Column names
+    vary between device families, so keys are derived from the header row
+    (e.g., "Total LUTs" -> "total_luts").
+
+    Args:
+        output: Raw text output containing a hierarchical utilization report
+
+    Returns:
+        List of dictionaries, one per instance, with "instance", "module",
+        "depth" and one numeric entry per resource column
+    """
+    rows = []
+    columns = None
+
+    for line in output.split("\n"):
+        if not line.lstrip().startswith("|"):
+            continue
+        cells = line.strip().strip("|").split("|")
+
+        # Header row defines the column keys for the rows that follow
+        if columns is None:
+            if len(cells) > 2 and cells[0].strip() == "Instance" and cells[1].strip() == "Module":
+                columns = [_COLUMN_NAME_RE.sub("_", c.strip()).strip("_").lower() for c in cells]
+            continue
+
+        if len(cells) != len(columns):
+            continue
+
+        # Instance names are indented by two spaces per hierarchy level
+        instance = cells[0].rstrip()
+        row = {
+            "instance": instance.strip(),
+            "module": cells[1].strip(),
+            "depth": (len(instance) - len(instance.lstrip()) - 1) // 2,
+        }
+        for key, cell in zip(columns[2:], cells[2:]):
+            try:
+                row[key] = float(cell)
+            except ValueError:
+                row[key] = cell.strip()
+        rows.append(row)
+
+    return rows
+
+
 def parse_messages(output: str) -> dict:
     """
     Parse Vivado messages into categorized lists.
@@ -450,14 +748,9 @@ def parse_messages(output: str) -> dict:
     # Categorize each line by its severity prefix
     for line in output.split("\n"):
         line = line.strip()
-        if re.match(r"ERROR:", line):
-            result["errors"].append(line)
-        elif re.match(r"CRITICAL WARNING:", line):
-            result["critical_warnings"].append(line)
-        elif re.match(r"WARNING:", line):
-            result["warnings"].append(line)
-        elif re.match(r"INFO:", line):
-            result["info"].append(line)
+        match = _MESSAGE_SEVERITY_RE.match(line)
+        if match:
+            result[_MESSAGE_CATEGORIES[match.group(1)]].append(line)
 
     return result
 
@@ -488,7 +781,7 @@ def parse_timing_paths_summary(output: str, max_paths: int = 5) -> list[dict]:
 
     # Split output into individual path blocks
     # Each path starts with "Slack" line
-    path_blocks = re.split(r'\n(?=Slack\s*(?:\([A-Z]+\))?\s*:)', output)
+    path_blocks = _PATH_SPLIT_RE.split(output)
 
     for block in path_blocks:
         if not block.strip() or 'Slack' not in block:
@@ -497,42 +790,42 @@ def parse_timing_paths_summary(output: str, max_paths: int = 5) -> list[dict]:
         path_info = {}
 
         # Extract slack value
-        slack_match = re.search(r'Slack\s*(?:\([A-Z]+\))?\s*:\s*([-\d.]+)\s*ns', block)
+        slack_match = _PATH_SLACK_RE.search(block)
         if slack_match:
             path_info['slack'] = float(slack_match.group(1))
 
         # Extract source (startpoint)
-        source_match = re.search(r'Source:\s*(\S+)', block)
+        source_match = _PATH_SOURCE_RE.search(block)
         if source_match:
             path_info['source'] = source_match.group(1)
 
         # Extract destination (endpoint)
-        dest_match = re.search(r'Destination:\s*(\S+)', block)
+        dest_match = _PATH_DESTINATION_RE.search(block)
         if dest_match:
             path_info['destination'] = dest_match.group(1)
 
         # Extract source clock
-        src_clk_match = re.search(r'Source Clock:\s*(\S+)', block)
+        src_clk_match = _PATH_SOURCE_CLOCK_RE.search(block)
         if src_clk_match:
             path_info['source_clock'] = src_clk_match.group(1)
 
         # Extract destination clock
-        dst_clk_match = re.search(r'Destination Clock:\s*(\S+)', block)
+        dst_clk_match = _PATH_DEST_CLOCK_RE.search(block)
         if dst_clk_match:
             path_info['dest_clock'] = dst_clk_match.group(1)
 
         # Extract requirement
-        req_match = re.search(r'Requirement:\s*([-\d.]+)\s*ns', block)
+        req_match = _PATH_REQUIREMENT_RE.search(block)
         if req_match:
             path_info['requirement'] = float(req_match.group(1))
 
         # Extract data path delay
-        data_delay_match = re.search(r'Data Path Delay:\s*([-\d.]+)\s*ns', block)
+        data_delay_match = _PATH_DATA_DELAY_RE.search(block)
         if data_delay_match:
             path_info['data_path_delay'] = float(data_delay_match.group(1))
 
         # Extract logic levels
-        levels_match = re.search(r'Logic Levels:\s*(\d+)', block)
+        levels_match = _PATH_LOGIC_LEVELS_RE.search(block)
         if levels_match:
             path_info['logic_levels'] = int(levels_match.group(1))
 
@@ -564,7 +857,8 @@ async def list_tools() -> list[Tool]:
 
     1. Session Management: start_session, stop_session, session_status
     2. Project Management: open_project, close_project, get_project_info
-    3. Design Flow: run_synthesis, run_implementation, generate_bitstream
+    3. Design Flow: run_synthesis, parallel_synth_explore, run_implementation,
+       generate_bitstream
     4. Reports/Analysis: get_timing_summary, get_timing_paths, get_utilization, etc.
     5. Design Queries: get_design_hierarchy, get_ports, get_nets, get_cells
     6. Raw TCL: run_tcl for advanced operations
@@ -575,7 +869,7 @@ async def list_tools() -> list[Tool]:
     Returns:
         List of Tool objects with name, description, and inputSchema
     """
-    return [
+    tools = [
         # =====================================================================
         # SESSION MANAGEMENT TOOLS
         # =====================================================================
@@ -609,7 +903,12 @@ async def list_tools() -> list[Tool]:
             description="Get status and statistics of the current Vivado session",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "include_history": {
+                        "type": "boolean",
+                        "description": "Include the last 100 commands with timing info (default: true)"
+                    }
+                },
                 "required": []
             }
         ),
@@ -698,6 +997,29 @@ async def list_tools() -> list[Tool]:
                 "required": []
             }
         ),
+        Tool(
+            name="parallel_synth_explore",
+            description="Run several synthesis strategies in parallel and compare their timing results (WNS/TNS per strategy). Each strategy gets its own synthesis run in the current project.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "strategies": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Synthesis strategies to try (e.g., ['Flow_PerfOptimized_high', 'Flow_AreaOptimized_high'])"
+                    },
+                    "jobs": {
+                        "type": "integer",
+                        "description": "Number of runs Vivado may execute concurrently (default: one per strategy)"
+                    },
+                    "timeout": {
+                        "type": "integer",
+                        "description": "Timeout in seconds for all runs to finish (default: 3600 = 60 minutes)"
+                    }
+                },
+                "required": ["strategies"]
+            }
+        ),
         Tool(
             name="run_implementation",
             description="Run implementation (place and route) on the current project",
@@ -721,7 +1043,12 @@ async def list_tools() -> list[Tool]:
             description="Generate bitstream for the implemented design",
             inputSchema={
                 "type": "object",
-                "properties": {},
+                "properties": {
+                    "compress": {
+                        "type": "boolean",
+                        "description": "Compress the bitstream (BITSTREAM.GENERAL.COMPRESS) for faster programming (default: true). If false, the project's own setting is used"
+                    }
+                },
                 "required": []
             }
         ),
@@ -801,7 +1128,7 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "hierarchical": {
                         "type": "boolean",
-                        "description": "Include hierarchical breakdown (default: false)"
+                        "description": "Include per-instance hierarchical breakdown (default: false)"
                     },
                     "detail_level": {
                         "type": "string",
@@ -862,6 +1189,10 @@ async def list_tools() -> list[Tool]:
                     "instance_pattern": {
                         "type": "string",
                         "description": "Wildcard pattern to filter instances (e.g., '*cpu*', 'core/alu/*')"
+                    },
+                    "build_tree": {
+                        "type": "boolean",
+                        "description": "Also return the cells as a nested tree keyed by instance name (default: false)"
                     }
                 },
                 "required": []
@@ -1258,23 +1589,83 @@ async def list_tools() -> list[Tool]:
         )
     ]
 
+    # Every tool that talks to Vivado can be routed to a per-project session
+    for tool in tools:
+        if tool.name not in _PROJECTLESS_TOOLS:
+            tool.inputSchema["properties"]["project"] = PROJECT_ARGUMENT
+
+    return tools
+
 
 # =============================================================================
 # TOOL IMPLEMENTATION
 # =============================================================================
 
+# Serializes tool calls per session. Handlers often issue several dependent
+# Vivado commands (e.g., open_run, report, close_design), which must not
+# interleave with another tool call's commands on the same session. Calls
+# for different sessions (projects) run concurrently.
+_tool_locks: defaultdict[VivadoSession, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """
     Handle tool calls from MCP clients.
 
+    Vivado commands block (pexpect waits for output), so the tool runs in a
+    worker thread via dispatch_tool(). This keeps the event loop free to
+    handle other MCP traffic while a long command is running. The session is
+    picked from the pool by the optional "project" argument, and only calls
+    for the same session wait on each other.
+
+    Args:
+        name: The tool name being called
+        arguments: Dictionary of arguments passed to the tool
+
+    Returns:
+        List containing one TextContent with JSON response
+    """
+    project = arguments.get("project")
+    while True:
+        try:
+            session = get_session(project)
+        except RuntimeError as e:
+            return [TextContent(type="text", text=dumps_json({
+                "error": str(e),
+                "success": False
+            }))]
+
+        async with _tool_locks[session]:
+            # The session may have been stopped and dropped from the pool
+            # while this call waited; if so, resolve the project again
+            if not is_pooled_session(session):
+                continue
+            response = await asyncio.to_thread(dispatch_tool, name, arguments, session)
+
+            # A project session that isn't running (never started, or failed
+            # to start) isn't kept around holding a pool slot
+            if project and not session.is_running and get_dedicated_session(project) is session:
+                reset_session(project)
+
+        if not is_pooled_session(session):
+            _tool_locks.pop(session, None)
+        return response
+
+
+def dispatch_tool(name: str, arguments: dict, session: VivadoSession) -> list[TextContent]:
+    """
+    Route a tool call to its implementation.
+
     This is the main dispatcher that routes tool calls to their implementations.
     Each tool returns a list containing a single TextContent with JSON-formatted
-    results.
+    results. It blocks while Vivado commands run, so call_tool() runs it in a
+    worker thread.
 
     Args:
         name: The tool name being called
         arguments: Dictionary of arguments passed to the tool
+        session: The Vivado session (default or per-project) to run it on
 
     Returns:
         List containing one TextContent with JSON response
@@ -1288,963 +1679,1371 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         - error: Error message string
         - success: False
     """
-    # Get the singleton Vivado session
-    session = get_session()
-
-    # =========================================================================
-    # SESSION MANAGEMENT
-    # =========================================================================
-
-    if name == "start_session":
-        # Start Vivado TCL session
-        # This spawns a persistent Vivado process that stays running
-        vivado_path = arguments.get("vivado_path", "vivado")
-        session.vivado_path = vivado_path
-        result = session.start()
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "message": result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
+    handler = _DISPATCH.get(name)
+    if handler is None:
+        return [TextContent(type="text", text=dumps_json({"error": f"Unknown tool: {name}"}))]
 
-    elif name == "stop_session":
-        # Stop Vivado session gracefully
-        result = session.stop()
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "message": result.output
-        }, indent=2))]
-
-    elif name == "session_status":
-        # Get session statistics (commands run, errors, timing, etc.)
-        stats = session.get_stats()
-        return [TextContent(type="text", text=json.dumps(stats, indent=2))]
-
-    elif name == "check_session_health":
-        # Check if session is responsive and optionally recover
-        auto_recover = arguments.get("auto_recover", True)
-
-        if not session.is_running:
-            if auto_recover:
-                result = session.start()
-                return [TextContent(type="text", text=json.dumps({
-                    "healthy": result.success,
-                    "action": "started",
-                    "message": "Session was not running, started new session",
-                    "elapsed_ms": result.elapsed_ms
-                }, indent=2))]
-            else:
-                return [TextContent(type="text", text=json.dumps({
-                    "healthy": False,
-                    "action": "none",
-                    "message": "Session not running (auto_recover=false)"
-                }, indent=2))]
-
-        # Session thinks it's running, check if actually responsive
-        is_healthy = session.is_healthy()
-
-        if is_healthy:
-            return [TextContent(type="text", text=json.dumps({
-                "healthy": True,
-                "action": "none",
-                "message": "Session is healthy and responsive"
-            }, indent=2))]
+    # All tools except session management require an active Vivado session
+    if name not in _SESSIONLESS_TOOLS and not session.is_running:
+        return [TextContent(type="text", text=dumps_json({
+            "error": "Vivado session not running. Call start_session first.",
+            "success": False
+        }))]
+
+    return handler(session, arguments)
+
+
+# =============================================================================
+# TOOL HANDLERS: SESSION MANAGEMENT
+# =============================================================================
+
+def _handle_start_session(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """
+    Start Vivado TCL session.
+
+    This spawns a persistent Vivado process that stays running. With a
+    project argument, the project's dedicated session is started and the
+    project is opened in it.
+    """
+    # Per-project sessions inherit the default session's Vivado path
+    vivado_path = arguments.get("vivado_path", session.vivado_path)
+    session.vivado_path = vivado_path
+    result = session.start()
+    response = {
+        "success": result.success,
+        "message": result.output,
+        "elapsed_ms": result.elapsed_ms
+    }
+
+    project = arguments.get("project")
+    if project and result.success and session.current_project is None:
+        open_result = session.run_tcl(f"open_project {tcl_brace(project)}")
+        if open_result.success:
+            session.current_project = project
+        response["success"] = open_result.success
+        response["project"] = project
+        response["project_output"] = open_result.output
+
+    return [TextContent(type="text", text=dumps_json(response))]
+
+
+def _handle_stop_session(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Stop Vivado session gracefully."""
+    project = arguments.get("project")
+    if project and get_dedicated_session(project) is not session:
+        # The project is only open in the shared default session
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "message": f"{project} has no session of its own (it is open in the default "
+                       f"session). Use close_project, or stop_session without a project "
+                       f"to stop the default session."
+        }))]
+
+    result = session.stop()
+    if project:
+        # Drop the per-project session from the pool to free its slot
+        reset_session(project)
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "message": result.output
+    }))]
+
+
+def _handle_session_status(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get session statistics (commands run, errors, timing, etc.)."""
+    stats = session.get_stats(include_history=arguments.get("include_history", True))
+    return [TextContent(type="text", text=dumps_json(stats))]
+
+
+def _handle_check_session_health(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Check if session is responsive and optionally recover."""
+    auto_recover = arguments.get("auto_recover", True)
 
-        # Session is unresponsive
+    if not session.is_running:
         if auto_recover:
-            result = session.ensure_healthy()
-            return [TextContent(type="text", text=json.dumps({
+            result = session.start()
+            return [TextContent(type="text", text=dumps_json({
                 "healthy": result.success,
-                "action": "restarted",
-                "message": "Session was unresponsive, restarted",
+                "action": "started",
+                "message": "Session was not running, started new session",
                 "elapsed_ms": result.elapsed_ms
-            }, indent=2))]
+            }))]
         else:
-            return [TextContent(type="text", text=json.dumps({
+            return [TextContent(type="text", text=dumps_json({
                 "healthy": False,
                 "action": "none",
-                "message": "Session is unresponsive (auto_recover=false)"
-            }, indent=2))]
-
-    elif name == "get_host_status":
-        # Get host system status for memory-based server selection
-        import socket
-        import psutil
-
-        hostname = socket.gethostname()
-        mem = psutil.virtual_memory()
-        mem_free_gb = mem.available / (1024 ** 3)
-        mem_total_gb = mem.total / (1024 ** 3)
-
-        # Build suggestion based on free memory (64GB threshold)
-        suggestion = None
-        if mem_free_gb < 64:
-            suggestion = f"Low memory ({mem_free_gb:.1f}GB free). Use vivado-snoke instead."
-
-        return [TextContent(type="text", text=json.dumps({
-            "hostname": hostname,
-            "memory_free_gb": round(mem_free_gb, 1),
-            "memory_total_gb": round(mem_total_gb, 1),
-            "memory_percent_used": mem.percent,
-            "vivado_session_active": session.is_running,
-            "suggestion": suggestion
-        }, indent=2))]
-
-    # =========================================================================
-    # SESSION CHECK
-    # =========================================================================
-    # All remaining commands require an active Vivado session
-
-    if not session.is_running:
-        return [TextContent(type="text", text=json.dumps({
-            "error": "Vivado session not running. Call start_session first.",
-            "success": False
-        }, indent=2))]
-
-    # =========================================================================
-    # PROJECT MANAGEMENT
-    # =========================================================================
-
-    if name == "open_project":
-        # Open a Vivado project file (.xpr)
-        project_path = arguments.get("project_path", "")
-        # Use braces to handle paths with spaces
-        result = session.run_tcl(f"open_project {{{project_path}}}")
-        if result.success:
-            session.current_project = project_path
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "output": result.output,
+                "message": "Session not running (auto_recover=false)"
+            }))]
+
+    # Session thinks it's running, check if actually responsive
+    is_healthy = session.is_healthy()
+
+    if is_healthy:
+        return [TextContent(type="text", text=dumps_json({
+            "healthy": True,
+            "action": "none",
+            "message": "Session is healthy and responsive"
+        }))]
+
+    # Session is unresponsive
+    if auto_recover:
+        result = session.ensure_healthy()
+        return [TextContent(type="text", text=dumps_json({
+            "healthy": result.success,
+            "action": "restarted",
+            "message": "Session was unresponsive, restarted",
             "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
+        }))]
+    else:
+        return [TextContent(type="text", text=dumps_json({
+            "healthy": False,
+            "action": "none",
+            "message": "Session is unresponsive (auto_recover=false)"
+        }))]
+
+
+def _handle_get_host_status(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get host system status for memory-based server selection."""
+    import socket
+    import psutil
+
+    hostname = socket.gethostname()
+    mem = psutil.virtual_memory()
+    mem_free_gb = mem.available / (1024 ** 3)
+    mem_total_gb = mem.total / (1024 ** 3)
+
+    # Build suggestion based on free memory (64GB threshold)
+    suggestion = None
+    if mem_free_gb < 64:
+        suggestion = f"Low memory ({mem_free_gb:.1f}GB free). Use vivado-snoke instead."
+
+    return [TextContent(type="text", text=dumps_json({
+        "hostname": hostname,
+        "memory_free_gb": round(mem_free_gb, 1),
+        "memory_total_gb": round(mem_total_gb, 1),
+        "memory_percent_used": mem.percent,
+        "vivado_session_active": session.is_running,
+        "suggestion": suggestion
+    }))]
 
-    elif name == "close_project":
-        # Close the current project
-        result = session.run_tcl("close_project")
-        session.current_project = None
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "output": result.output
-        }, indent=2))]
-
-    elif name == "get_project_info":
-        # Get various project properties
-        commands = [
-            "current_project",                                    # Project name
-            "get_property PART [current_project]",               # Target FPGA part
-            "get_property TARGET_LANGUAGE [current_project]",    # Verilog/VHDL
-            "get_property DIRECTORY [current_project]"           # Project directory
-        ]
-        results = {}
-        for cmd in commands:
-            r = session.run_tcl(cmd)
-            results[cmd] = r.output
-        return [TextContent(type="text", text=json.dumps(results, indent=2))]
-
-    # =========================================================================
-    # DESIGN FLOW
-    # =========================================================================
-
-    elif name == "run_synthesis":
-        # Run synthesis with optional parallel jobs
-        # reset_run clears previous results, launch_runs starts synthesis,
-        # wait_on_run blocks until complete
-        jobs = arguments.get("jobs", 4)
-        timeout = arguments.get("timeout", 1800)  # 30 min default
 
-        result = session.run_tcl(
-            f"reset_run synth_1; launch_runs synth_1 -jobs {jobs}; wait_on_run synth_1",
-            timeout_override=timeout
-        )
+# =============================================================================
+# TOOL HANDLERS: PROJECT MANAGEMENT
+# =============================================================================
 
-        # Verify actual run status (more reliable than output parsing)
-        verification = verify_run_status(session, "synth_1")
-        actual_success = verification["actually_succeeded"]
+def _handle_open_project(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Open a Vivado project file (.xpr)."""
+    project_path = arguments.get("project_path", "")
+    # Quote so paths with spaces (or stray braces) stay a single word
+    result = session.run_tcl(f"open_project {tcl_brace(project_path)}")
+    if result.success:
+        session.current_project = project_path
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "output": result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_close_project(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Close the current project."""
+    result = session.run_tcl("close_project")
+    session.current_project = None
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "output": result.output
+    }))]
+
+
+def _handle_get_project_info(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get various project properties."""
+    commands = [
+        "current_project",                                    # Project name
+        "get_property PART [current_project]",               # Target FPGA part
+        "get_property TARGET_LANGUAGE [current_project]",    # Verilog/VHDL
+        "get_property DIRECTORY [current_project]"           # Project directory
+    ]
+    # All four properties are read in a single round-trip
+    results = {
+        cmd: r.output for cmd, r in zip(commands, session.run_tcl_batch(commands))
+    }
+    return [TextContent(type="text", text=dumps_json(results))]
 
-        response = {
-            "success": actual_success,
-            "output": result.output,
-            "elapsed_ms": result.elapsed_ms,
-            "run_status": verification["status"],
-            "run_progress": verification["progress"],
-        }
 
-        # Note if there was a mismatch between output parsing and actual status
-        if not result.success and actual_success:
-            response["note"] = "Output contained error-like strings but run completed successfully"
+# =============================================================================
+# TOOL HANDLERS: DESIGN FLOW
+# =============================================================================
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
+def _handle_run_synthesis(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """
+    Run synthesis with optional parallel jobs.
 
-    elif name == "run_implementation":
-        # Run place and route
-        jobs = arguments.get("jobs", 4)
-        timeout = arguments.get("timeout", 3600)  # 60 min default
+    reset_run clears previous results, launch_runs starts synthesis,
+    wait_on_run blocks until complete.
+    """
+    jobs = arguments.get("jobs", 4)
+    timeout = arguments.get("timeout", 1800)  # 30 min default
+
+    result = session.run_tcl(
+        f"reset_run synth_1; launch_runs synth_1 -jobs {jobs}; wait_on_run synth_1",
+        timeout_override=timeout
+    )
+
+    # Verify actual run status (more reliable than output parsing)
+    verification = verify_run_status(session, "synth_1")
+    actual_success = verification["actually_succeeded"]
+
+    response = {
+        "success": actual_success,
+        "output": result.output,
+        "elapsed_ms": result.elapsed_ms,
+        "run_status": verification["status"],
+        "run_progress": verification["progress"],
+    }
 
-        result = session.run_tcl(
-            f"launch_runs impl_1 -jobs {jobs}; wait_on_run impl_1",
-            timeout_override=timeout
-        )
+    # Note if there was a mismatch between output parsing and actual status
+    if not result.success and actual_success:
+        response["note"] = "Output contained error-like strings but run completed successfully"
 
-        # Verify actual run status (more reliable than output parsing)
-        verification = verify_run_status(session, "impl_1")
-        actual_success = verification["actually_succeeded"]
+    return [TextContent(type="text", text=dumps_json(response))]
 
-        response = {
-            "success": actual_success,
-            "output": result.output,
-            "elapsed_ms": result.elapsed_ms,
+
+def _handle_parallel_synth_explore(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """
+    Try several synthesis strategies at once.
+
+    Each strategy gets its own run, and all runs go to a single launch_runs
+    so Vivado dispatches them in parallel instead of one after another.
+    """
+    strategies = arguments.get("strategies", [])
+    if isinstance(strategies, str):
+        strategies = [strategies]
+    jobs = arguments.get("jobs", len(strategies))
+    timeout = arguments.get("timeout", 3600)  # 60 min default
+
+    if not strategies:
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "error": "At least one strategy is required"
+        }))]
+
+    # New runs use the same synthesis flow as the project's default run
+    flow_result = session.run_tcl("get_property FLOW [get_runs synth_1]")
+    flow = flow_result.output.strip() if flow_result.success else ""
+
+    # Create (or reset and re-target) one run per strategy
+    runs = []
+    for i, strategy in enumerate(strategies, start=1):
+        run_name = f"synth_explore_{i}"
+        setup = session.run_tcl(
+            f"if {{[llength [get_runs -quiet {run_name}]]}} "
+            f"{{reset_run {run_name}; set_property STRATEGY {tcl_brace(strategy)} [get_runs {run_name}]}} "
+            f"else {{create_run {run_name} -flow {tcl_brace(flow)} -strategy {tcl_brace(strategy)}}}"
+        )
+        if not setup.success:
+            return [TextContent(type="text", text=dumps_json({
+                "success": False,
+                "error": f"Failed to create run for strategy '{strategy}': {setup.output}",
+                "strategy": strategy
+            }))]
+        runs.append((strategy, run_name))
+
+    # One launch_runs for all runs, then wait for every one of them
+    run_names = " ".join(run_name for _, run_name in runs)
+    wait_cmds = "; ".join(f"wait_on_run {run_name}" for _, run_name in runs)
+    result = session.run_tcl(
+        f"launch_runs {run_names} -jobs {jobs}; {wait_cmds}",
+        timeout_override=timeout
+    )
+
+    # Collect timing for each run that completed
+    strategy_results = []
+    for strategy, run_name in runs:
+        verification = verify_run_status(session, run_name)
+        entry = {
+            "strategy": strategy,
+            "run_name": run_name,
+            "success": verification["actually_succeeded"],
             "run_status": verification["status"],
-            "run_progress": verification["progress"],
         }
+        if verification["actually_succeeded"]:
+            open_result = session.run_tcl(f"open_run {run_name} -name {run_name}",
+                                          capture_output=False)
+            if open_result.success:
+                timing = parse_timing_summary(
+                    session.run_tcl("report_timing_summary -no_header -return_string").output
+                )
+                for key in ("wns", "tns", "whs", "ths", "met"):
+                    entry[key] = timing[key]
+                session.run_tcl("close_design", capture_output=False)
+        strategy_results.append(entry)
+
+    # Best strategy = highest setup slack among completed runs
+    ranked = [r for r in strategy_results if r.get("wns") is not None]
+    best = max(ranked, key=lambda r: r["wns"]) if ranked else None
+
+    response = {
+        "success": any(r["success"] for r in strategy_results),
+        "elapsed_ms": result.elapsed_ms,
+        "results": strategy_results,
+        "best_strategy": best["strategy"] if best else None,
+    }
+    if not result.success:
+        response["output"] = result.output
+
+    return [TextContent(type="text", text=dumps_json(response))]
+
+
+def _handle_run_implementation(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Run place and route."""
+    jobs = arguments.get("jobs", 4)
+    timeout = arguments.get("timeout", 3600)  # 60 min default
+
+    result = session.run_tcl(
+        f"launch_runs impl_1 -jobs {jobs}; wait_on_run impl_1",
+        timeout_override=timeout
+    )
+
+    # Verify actual run status (more reliable than output parsing)
+    verification = verify_run_status(session, "impl_1")
+    actual_success = verification["actually_succeeded"]
+
+    response = {
+        "success": actual_success,
+        "output": result.output,
+        "elapsed_ms": result.elapsed_ms,
+        "run_status": verification["status"],
+        "run_progress": verification["progress"],
+    }
+
+    # Note if there was a mismatch between output parsing and actual status
+    if not result.success and actual_success:
+        response["note"] = "Output contained error-like strings but run completed successfully"
+
+    return [TextContent(type="text", text=dumps_json(response))]
+
 
-        # Note if there was a mismatch between output parsing and actual status
-        if not result.success and actual_success:
-            response["note"] = "Output contained error-like strings but run completed successfully"
+def _handle_generate_bitstream(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """
+    Generate bitstream (programming file).
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    With compress=True, BITSTREAM.GENERAL.COMPRESS is set by a temporary
+    write_bitstream pre-hook on impl_1, since the implemented design is only
+    open inside the run. Any hook the user already set is chained from it
+    and restored afterwards. With compress=False the project's own setting
+    (e.g. from XDC) is left alone.
+    """
+    compress = arguments.get("compress", True)
+    launch = "launch_runs impl_1 -to_step write_bitstream; wait_on_run impl_1"
 
-    elif name == "generate_bitstream":
-        # Generate bitstream (programming file)
-        result = session.run_tcl("launch_runs impl_1 -to_step write_bitstream; wait_on_run impl_1")
-        return [TextContent(type="text", text=json.dumps({
+    if not compress:
+        result = session.run_tcl(launch)
+        return [TextContent(type="text", text=dumps_json({
             "success": result.success,
             "output": result.output,
             "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
+        }))]
+
+    hook_result, dir_result = session.run_tcl_batch([
+        "get_property STEPS.WRITE_BITSTREAM.TCL.PRE [get_runs impl_1]",
+        "get_property DIRECTORY [current_project]",
+    ])
+    if not (hook_result.success and dir_result.success):
+        failed = hook_result if not hook_result.success else dir_result
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "error": f"Failed to read impl_1 settings: {failed.output}"
+        }))]
+
+    # The hook lives in the project directory, so concurrent runs on other
+    # projects have their own file and it survives /tmp cleanup
+    hook_file = Path(dir_result.output.strip()) / ".vivado_mcp" / "impl_1_write_bitstream_pre.tcl"
+    previous_hook = hook_result.output.strip()
+    if previous_hook == str(hook_file):
+        # Left over from an interrupted earlier call, not the user's hook
+        previous_hook = ""
+
+    hook_lines = []
+    if previous_hook:
+        hook_lines.append(f"source {tcl_brace(previous_hook)}")
+    hook_lines.append("set_property BITSTREAM.GENERAL.COMPRESS TRUE [current_design]")
+    try:
+        hook_file.parent.mkdir(parents=True, exist_ok=True)
+        hook_file.write_text("\n".join(hook_lines) + "\n")
+    except OSError as e:
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "error": f"Failed to write bitstream hook {hook_file}: {e}"
+        }))]
+
+    setup = session.run_tcl(
+        f"set_property STEPS.WRITE_BITSTREAM.TCL.PRE {tcl_brace(hook_file)} [get_runs impl_1]",
+        capture_output=False,
+    )
+    if not setup.success:
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "error": f"Failed to set bitstream compression hook: {setup.output}"
+        }))]
+
+    result = session.run_tcl(launch)
+
+    # Put the user's hook (or none) back so the project isn't left changed
+    restore = session.run_tcl(
+        f"set_property STEPS.WRITE_BITSTREAM.TCL.PRE {tcl_brace(previous_hook)} [get_runs impl_1]",
+        capture_output=False,
+    )
+    response = {
+        "success": result.success,
+        "output": result.output,
+        "compressed": True,
+        "elapsed_ms": result.elapsed_ms
+    }
+    if not restore.success:
+        response["warning"] = (
+            f"Could not restore STEPS.WRITE_BITSTREAM.TCL.PRE on impl_1 "
+            f"(was {previous_hook or 'unset'}): {restore.output}"
+        )
+    return [TextContent(type="text", text=dumps_json(response))]
 
-    # =========================================================================
-    # REPORTS AND ANALYSIS
-    # =========================================================================
 
-    elif name == "get_timing_summary":
-        # Get timing summary with parsed metrics
-        report_type = arguments.get("report_type", "summary")
-        detail_level = arguments.get("detail_level", "summary")
+# =============================================================================
+# TOOL HANDLERS: REPORTS AND ANALYSIS
+# =============================================================================
 
-        # Run Vivado timing summary report
-        result = session.run_tcl("report_timing_summary -no_header -return_string")
+def _handle_get_timing_summary(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get timing summary with parsed metrics."""
+    report_type = arguments.get("report_type", "summary")
+    detail_level = arguments.get("detail_level", "summary")
+
+    # Run Vivado timing summary report
+    result = session.run_tcl("report_timing_summary -no_header -return_string")
+
+    # Parse the raw output into structured data
+    parsed = parse_timing_summary(result.output)
+    parsed["success"] = result.success
+    parsed["elapsed_ms"] = result.elapsed_ms
+
+    # Control output verbosity based on detail_level
+    if detail_level == "summary":
+        # Only return parsed metrics, no raw output
+        parsed.pop("raw", None)
+    elif detail_level == "standard":
+        # Truncate raw output if too large (half of max to leave room for other data)
+        if "raw" in parsed and len(parsed["raw"]) > MAX_RESPONSE_CHARS // 2:
+            truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS // 2)
+            parsed["raw"] = truncated["content"]
+            if truncated["truncated"]:
+                parsed["raw_truncated"] = True
+                parsed["raw_total_chars"] = truncated["total_chars"]
+    elif detail_level == "full":
+        # Keep complete raw output but apply safety truncation
+        if "raw" in parsed and len(parsed["raw"]) > MAX_RESPONSE_CHARS:
+            truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS)
+            parsed["raw"] = truncated["content"]
+            if truncated["truncated"]:
+                parsed["raw_truncated"] = True
+                parsed["raw_total_chars"] = truncated["total_chars"]
+                parsed["truncation_message"] = truncated["truncation_message"]
+
+    return [TextContent(type="text", text=dumps_json(parsed))]
+
+
+def _handle_get_timing_paths(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """
+    Get detailed timing path information.
 
-        # Parse the raw output into structured data
-        parsed = parse_timing_summary(result.output)
-        parsed["success"] = result.success
-        parsed["elapsed_ms"] = result.elapsed_ms
+    Useful for debugging timing violations.
+    """
+    num_paths = arguments.get("num_paths", 10)
+    slack_threshold = arguments.get("slack_threshold", 0)  # 0 = failing paths only
+    path_type = arguments.get("path_type", "setup")
+    from_pin = arguments.get("from_pin")
+    to_pin = arguments.get("to_pin")
+    through = arguments.get("through")
+    clock = arguments.get("clock")
+    detail_level = arguments.get("detail_level", "summary")
+
+    # Build the report_timing command
+    delay_type = "max" if path_type == "setup" else "min"
+    cmd = f"report_timing -delay_type {delay_type} -max_paths {num_paths} -slack_lesser_than {slack_threshold}"
+
+    # Add optional path filters
+    if from_pin:
+        cmd += f" -from {tcl_brace(from_pin)}"
+    if to_pin:
+        cmd += f" -to {tcl_brace(to_pin)}"
+    if through:
+        cmd += f" -through {tcl_brace(through)}"
+    if clock:
+        cmd += f" -filter {{CLOCK == {clock}}}"
+
+    cmd += " -return_string"
+    result = session.run_tcl(cmd)
+
+    # Build response with filter information
+    response = {
+        "success": result.success,
+        "elapsed_ms": result.elapsed_ms,
+        "filters_applied": {
+            "path_type": path_type,
+            "num_paths": num_paths,
+            "slack_threshold": slack_threshold
+        }
+    }
+
+    # Include any filters that were used
+    if from_pin:
+        response["filters_applied"]["from_pin"] = from_pin
+    if to_pin:
+        response["filters_applied"]["to_pin"] = to_pin
+    if through:
+        response["filters_applied"]["through"] = through
+    if clock:
+        response["filters_applied"]["clock"] = clock
+
+    # Handle output based on detail level
+    if result.success:
+        # Always parse paths into structured format
+        parsed_paths = parse_timing_paths_summary(result.output, max_paths=num_paths)
+        response["paths"] = parsed_paths
+        response["path_count"] = len(parsed_paths)
 
-        # Control output verbosity based on detail_level
         if detail_level == "summary":
-            # Only return parsed metrics, no raw output
-            parsed.pop("raw", None)
+            # Only return structured data, no raw output
+            pass
         elif detail_level == "standard":
-            # Truncate raw output if too large (half of max to leave room for other data)
-            if "raw" in parsed and len(parsed["raw"]) > MAX_RESPONSE_CHARS // 2:
-                truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS // 2)
-                parsed["raw"] = truncated["content"]
-                if truncated["truncated"]:
-                    parsed["raw_truncated"] = True
-                    parsed["raw_total_chars"] = truncated["total_chars"]
-        elif detail_level == "full":
-            # Keep complete raw output but apply safety truncation
-            if "raw" in parsed:
-                truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS)
-                parsed["raw"] = truncated["content"]
-                if truncated["truncated"]:
-                    parsed["raw_truncated"] = True
-                    parsed["raw_total_chars"] = truncated["total_chars"]
-                    parsed["truncation_message"] = truncated["truncation_message"]
-
-        return [TextContent(type="text", text=json.dumps(parsed, indent=2))]
-
-    elif name == "get_timing_paths":
-        # Get detailed timing path information
-        # Useful for debugging timing violations
-        num_paths = arguments.get("num_paths", 10)
-        slack_threshold = arguments.get("slack_threshold", 0)  # 0 = failing paths only
-        path_type = arguments.get("path_type", "setup")
-        from_pin = arguments.get("from_pin")
-        to_pin = arguments.get("to_pin")
-        through = arguments.get("through")
-        clock = arguments.get("clock")
-        detail_level = arguments.get("detail_level", "summary")
-
-        # Build the report_timing command
-        delay_type = "max" if path_type == "setup" else "min"
-        cmd = f"report_timing -delay_type {delay_type} -max_paths {num_paths} -slack_lesser_than {slack_threshold}"
-
-        # Add optional path filters
-        if from_pin:
-            cmd += f" -from {{{from_pin}}}"
-        if to_pin:
-            cmd += f" -to {{{to_pin}}}"
-        if through:
-            cmd += f" -through {{{through}}}"
-        if clock:
-            cmd += f" -filter {{CLOCK == {clock}}}"
-
-        cmd += " -return_string"
-        result = session.run_tcl(cmd)
-
-        # Build response with filter information
-        response = {
-            "success": result.success,
-            "elapsed_ms": result.elapsed_ms,
-            "filters_applied": {
-                "path_type": path_type,
-                "num_paths": num_paths,
-                "slack_threshold": slack_threshold
-            }
-        }
-
-        # Include any filters that were used
-        if from_pin:
-            response["filters_applied"]["from_pin"] = from_pin
-        if to_pin:
-            response["filters_applied"]["to_pin"] = to_pin
-        if through:
-            response["filters_applied"]["through"] = through
-        if clock:
-            response["filters_applied"]["clock"] = clock
-
-        # Handle output based on detail level
-        if result.success:
-            # Always parse paths into structured format
-            parsed_paths = parse_timing_paths_summary(result.output, max_paths=num_paths)
-            response["paths"] = parsed_paths
-            response["path_count"] = len(parsed_paths)
-
-            if detail_level == "summary":
-                # Only return structured data, no raw output
-                pass
-            elif detail_level == "standard":
-                # Include truncated raw for reference
+            # Include truncated raw for reference (only scanned when too large)
+            response["raw"] = result.output
+            if len(result.output) > MAX_RESPONSE_CHARS // 2:
                 truncated = truncate_response(result.output, MAX_RESPONSE_CHARS // 2)
                 response["raw"] = truncated["content"]
                 if truncated["truncated"]:
                     response["raw_truncated"] = True
                     response["raw_total_chars"] = truncated["total_chars"]
-            elif detail_level == "full":
-                # Include complete raw output
+        elif detail_level == "full":
+            # Include complete raw output
+            response["raw"] = result.output
+            if len(result.output) > MAX_RESPONSE_CHARS:
                 truncated = truncate_response(result.output, MAX_RESPONSE_CHARS)
                 response["raw"] = truncated["content"]
                 if truncated["truncated"]:
                     response["raw_truncated"] = True
                     response["raw_total_chars"] = truncated["total_chars"]
                     response["truncation_message"] = truncated["truncation_message"]
-        else:
-            response["error"] = result.output
+    else:
+        response["error"] = result.output
+
+    return [TextContent(type="text", text=dumps_json(response))]
+
+
+def _handle_get_utilization(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get resource utilization with parsed metrics."""
+    hierarchical = arguments.get("hierarchical", False)
+    detail_level = arguments.get("detail_level", "summary")
+    module_filter = arguments.get("module_filter")
+    threshold_percent = arguments.get("threshold_percent")
+
+    # Build utilization report command
+    cmd = "report_utilization -return_string"
+    if hierarchical:
+        # The hierarchical report has no flat summary table, so fetch both
+        # reports in a single round-trip and parse each view from it
+        hier_cmd = "report_utilization -hierarchical"
+        if module_filter:
+            hier_cmd += f" -hierarchical_pattern {tcl_brace(module_filter)}"
+        cmd = f"join [list [{cmd}] [{hier_cmd} -return_string]] \"\\n\""
+
+    if detail_level == "full":
+        # The full raw report can be large, so fetch it via a file
+        result = session.run_tcl_large(cmd, file_option=False)
+    else:
+        result = session.run_tcl(cmd)
+
+    # Parse into structured data
+    parsed = parse_utilization(result.output)
+    if hierarchical:
+        parsed["hierarchy"] = parse_hierarchical_utilization(result.output)
+    parsed["success"] = result.success
+    parsed["elapsed_ms"] = result.elapsed_ms
+
+    # Apply threshold filter if specified
+    if threshold_percent is not None:
+        for resource in ["lut", "ff", "bram", "dsp", "io"]:
+            if resource in parsed and parsed[resource]["percent"] < threshold_percent:
+                parsed[resource]["below_threshold"] = True
+
+    # Control output verbosity
+    if detail_level == "summary":
+        parsed.pop("raw", None)
+    elif detail_level == "standard":
+        if "raw" in parsed and len(parsed["raw"]) > MAX_RESPONSE_CHARS // 2:
+            truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS // 2)
+            parsed["raw"] = truncated["content"]
+            if truncated["truncated"]:
+                parsed["raw_truncated"] = True
+                parsed["raw_total_chars"] = truncated["total_chars"]
+    elif detail_level == "full":
+        if "raw" in parsed and len(parsed["raw"]) > MAX_RESPONSE_CHARS:
+            truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS)
+            parsed["raw"] = truncated["content"]
+            if truncated["truncated"]:
+                parsed["raw_truncated"] = True
+                parsed["raw_total_chars"] = truncated["total_chars"]
+                parsed["truncation_message"] = truncated["truncation_message"]
+
+    return [TextContent(type="text", text=dumps_json(parsed))]
+
+
+def _handle_get_clocks(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """
+    Get clock information from the design.
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
+    Clock reports can be large, so Vivado writes them to a file.
+    """
+    result = session.run_tcl_large("report_clocks")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "clocks": result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_get_messages(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get Vivado messages filtered by severity."""
+    severity = arguments.get("severity", "all")
+    result = session.run_tcl("get_msg_config -rules")
+    parsed = parse_messages(result.output)
+
+    # Apply severity filter
+    if severity != "all":
+        filtered = {
+            "error": parsed["errors"],
+            "critical": parsed["critical_warnings"],
+            "warning": parsed["warnings"]
+        }.get(severity, [])
+        parsed = {severity: filtered, "raw": parsed["raw"]}
+    parsed["success"] = result.success
+    return [TextContent(type="text", text=dumps_json(parsed))]
 
-    elif name == "get_utilization":
-        # Get resource utilization with parsed metrics
-        hierarchical = arguments.get("hierarchical", False)
-        detail_level = arguments.get("detail_level", "summary")
-        module_filter = arguments.get("module_filter")
-        threshold_percent = arguments.get("threshold_percent")
 
-        # Build utilization report command
-        cmd = "report_utilization -return_string"
-        if hierarchical:
-            cmd += " -hierarchical"
-            if module_filter:
-                cmd += f" -hierarchical_pattern {{{module_filter}}}"
+# =============================================================================
+# TOOL HANDLERS: DESIGN QUERIES
+# =============================================================================
 
+def _handle_get_design_hierarchy(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get the design hierarchy (instances and modules)."""
+    max_depth = arguments.get("max_depth", 3)
+    instance_pattern = arguments.get("instance_pattern", "*")
+    build_tree = arguments.get("build_tree", False)
+
+    # Reuse the previous result if the design hasn't changed since. The
+    # key includes the open design, so switching between e.g. synth_1 and
+    # impl_1 never serves the other design's hierarchy.
+    design = session.run_tcl("current_design -quiet")
+    design_name = design.output.strip() if design.success else ""
+    cache_key = ("get_design_hierarchy", session.current_project, design_name,
+                 instance_pattern, max_depth, build_tree)
+    cached = session.get_cached_design_query(cache_key)
+    if cached is not None:
+        return [TextContent(type="text", text=dumps_json(dict(cached, cached=True)))]
+
+    # Once every cell has been listed (pattern "*"), narrower patterns such
+    # as "alu*" are matched against that listing instead of re-scanning
+    all_cells_key = ("get_cells -hierarchical *", session.current_project, design_name)
+    all_cells = session.get_cached_design_query(all_cells_key)
+    cells = None
+    if all_cells is not None:
+        cells = match_hierarchical_cells(all_cells, instance_pattern)
+
+    if cells is not None:
+        success, error_output, elapsed_ms = True, "", 0.0
+    else:
+        # Get all hierarchical cells matching the pattern
+        cmd = f"get_cells -hierarchical {tcl_brace(instance_pattern)}"
         result = session.run_tcl(cmd)
+        success, error_output, elapsed_ms = result.success, result.output, result.elapsed_ms
+        cells = result.output.strip().split() if result.success else []
+        if result.success and instance_pattern == "*":
+            session.cache_design_query(all_cells_key, index_hierarchical_cells(cells))
+
+    if cells:
+
+        # Filter by hierarchy depth (count '/' separators)
+        filtered_cells = []
+        for cell in cells:
+            depth = get_hierarchy_depth(cell)
+            if depth <= max_depth:
+                filtered_cells.append(cell)
+
+        # Get module reference for each cell (limited for performance)
+        # A single TCL foreach prints "<cell>\t<ref>" per cell, so all
+        # lookups share one round-trip instead of one command per cell
+        cell_refs = {}
+        sample_cells = filtered_cells[:100]
+        if sample_cells:
+            cell_list = " ".join(tcl_brace(cell) for cell in sample_cells)
+            ref_result = session.run_tcl(
+                f"foreach c [list {cell_list}] "
+                f"{{catch {{puts \"$c\\t[get_property REF_NAME [get_cells $c]]\"}}}}"
+            )
+            for line in ref_result.output.split("\n"):
+                cell, sep, ref = line.partition("\t")
+                if sep and ref.strip() and cell in sample_cells:
+                    cell_refs[cell] = ref.strip()
 
-        # Parse into structured data
-        parsed = parse_utilization(result.output)
-        parsed["success"] = result.success
-        parsed["elapsed_ms"] = result.elapsed_ms
+        response = {
+            "success": True,
+            "cells": filtered_cells[:500],  # Limit for response size
+            "cell_count": len(filtered_cells),
+            "cell_modules": cell_refs,
+            "max_depth": max_depth,
+            "elapsed_ms": elapsed_ms
+        }
 
-        # Apply threshold filter if specified
-        if threshold_percent is not None:
-            for resource in ["lut", "ff", "bram", "dsp", "io"]:
-                if resource in parsed and parsed[resource]["percent"] < threshold_percent:
-                    parsed[resource]["below_threshold"] = True
+        # Nested tree view is only built on request
+        if build_tree:
+            response["tree"] = build_hierarchy_tree(filtered_cells[:500])
 
-        # Control output verbosity
-        if detail_level == "summary":
-            parsed.pop("raw", None)
-        elif detail_level == "standard":
-            if "raw" in parsed and len(parsed["raw"]) > MAX_RESPONSE_CHARS // 2:
-                truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS // 2)
-                parsed["raw"] = truncated["content"]
-                if truncated["truncated"]:
-                    parsed["raw_truncated"] = True
-                    parsed["raw_total_chars"] = truncated["total_chars"]
-        elif detail_level == "full":
-            if "raw" in parsed:
-                truncated = truncate_response(parsed["raw"], MAX_RESPONSE_CHARS)
-                parsed["raw"] = truncated["content"]
-                if truncated["truncated"]:
-                    parsed["raw_truncated"] = True
-                    parsed["raw_total_chars"] = truncated["total_chars"]
-                    parsed["truncation_message"] = truncated["truncation_message"]
+        if len(filtered_cells) > 500:
+            response["truncated"] = True
+            response["total_cells"] = len(filtered_cells)
+            response["message"] = "Cell list truncated. Use instance_pattern to filter or generate_full_report for complete hierarchy."
 
-        return [TextContent(type="text", text=json.dumps(parsed, indent=2))]
+        session.cache_design_query(cache_key, response)
+    else:
+        response = {
+            "success": success,
+            "cells": [],
+            "cell_count": 0,
+            "error": error_output if not success else "No cells found",
+            "elapsed_ms": elapsed_ms
+        }
 
-    elif name == "get_clocks":
-        # Get clock information from the design
-        result = session.run_tcl("report_clocks -return_string")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "clocks": result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "get_messages":
-        # Get Vivado messages filtered by severity
-        severity = arguments.get("severity", "all")
-        result = session.run_tcl("get_msg_config -rules")
-        parsed = parse_messages(result.output)
-
-        # Apply severity filter
-        if severity != "all":
-            filtered = {
-                "error": parsed["errors"],
-                "critical": parsed["critical_warnings"],
-                "warning": parsed["warnings"]
-            }.get(severity, [])
-            parsed = {severity: filtered, "raw": parsed["raw"]}
-        parsed["success"] = result.success
-        return [TextContent(type="text", text=json.dumps(parsed, indent=2))]
-
-    # =========================================================================
-    # DESIGN QUERIES
-    # =========================================================================
-
-    elif name == "get_design_hierarchy":
-        # Get the design hierarchy (instances and modules)
-        max_depth = arguments.get("max_depth", 3)
-        instance_pattern = arguments.get("instance_pattern", "*")
+    return [TextContent(type="text", text=dumps_json(response))]
 
-        # Get all hierarchical cells matching the pattern
-        cmd = f"get_cells -hierarchical {{{instance_pattern}}}"
-        result = session.run_tcl(cmd)
 
-        if result.success and result.output.strip():
-            cells = result.output.strip().split()
-
-            # Filter by hierarchy depth (count '/' separators)
-            filtered_cells = []
-            for cell in cells:
-                depth = get_hierarchy_depth(cell)
-                if depth <= max_depth:
-                    filtered_cells.append(cell)
-
-            # Build a hierarchical structure for easier visualization
-            hierarchy = {}
-            for cell in sorted(filtered_cells):
-                parts = cell.split('/')
-                current = hierarchy
-                for i, part in enumerate(parts):
-                    if part not in current:
-                        current[part] = {"_children": {}}
-                    current = current[part]["_children"]
-
-            # Get module reference for each cell (limited for performance)
-            cell_refs = {}
-            sample_cells = filtered_cells[:100]
-            for cell in sample_cells:
-                ref_result = session.run_tcl(f"get_property REF_NAME [get_cells {{{cell}}}]")
-                if ref_result.success and ref_result.output.strip():
-                    cell_refs[cell] = ref_result.output.strip()
-
-            response = {
-                "success": True,
-                "cells": filtered_cells[:500],  # Limit for response size
-                "cell_count": len(filtered_cells),
-                "cell_modules": cell_refs,
-                "max_depth": max_depth,
-                "elapsed_ms": result.elapsed_ms
-            }
+def _handle_get_ports(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get top-level I/O ports."""
+    result = session.run_tcl("get_ports *")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "ports": result.output.split() if result.success else [],
+        "elapsed_ms": result.elapsed_ms
+    }))]
 
-            if len(filtered_cells) > 500:
-                response["truncated"] = True
-                response["total_cells"] = len(filtered_cells)
-                response["message"] = "Cell list truncated. Use instance_pattern to filter or generate_full_report for complete hierarchy."
-        else:
-            response = {
-                "success": result.success,
-                "cells": [],
-                "cell_count": 0,
-                "error": result.output if not result.success else "No cells found",
-                "elapsed_ms": result.elapsed_ms
-            }
 
-        return [TextContent(type="text", text=json.dumps(response, indent=2))]
+def _handle_get_nets(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Search for nets by pattern."""
+    pattern = arguments.get("pattern", "*")
+    limit = arguments.get("limit", 100)
+    # Use lrange to limit results
+    result = session.run_tcl(f"lrange [get_nets {tcl_brace(pattern)}] 0 {limit-1}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "nets": result.output.split() if result.success else [],
+        "elapsed_ms": result.elapsed_ms
+    }))]
 
-    elif name == "get_ports":
-        # Get top-level I/O ports
-        result = session.run_tcl("get_ports *")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "ports": result.output.split() if result.success else [],
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "get_nets":
-        # Search for nets by pattern
-        pattern = arguments.get("pattern", "*")
-        limit = arguments.get("limit", 100)
-        # Use lrange to limit results
-        result = session.run_tcl(f"lrange [get_nets {{{pattern}}}] 0 {limit-1}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "nets": result.output.split() if result.success else [],
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "get_cells":
-        # Search for cells/instances by pattern
-        pattern = arguments.get("pattern", "*")
-        limit = arguments.get("limit", 100)
-        result = session.run_tcl(f"lrange [get_cells {{{pattern}}}] 0 {limit-1}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "cells": result.output.split() if result.success else [],
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
 
-    # =========================================================================
-    # RAW TCL
-    # =========================================================================
+def _handle_get_cells(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Search for cells/instances by pattern."""
+    pattern = arguments.get("pattern", "*")
+    limit = arguments.get("limit", 100)
+    result = session.run_tcl(f"lrange [get_cells {tcl_brace(pattern)}] 0 {limit-1}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "cells": result.output.split() if result.success else [],
+        "elapsed_ms": result.elapsed_ms
+    }))]
 
-    elif name == "run_tcl":
-        # Execute arbitrary TCL command (escape hatch for advanced users)
-        command = arguments.get("command", "")
-        result = session.run_tcl(command)
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "output": result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    # =========================================================================
-    # SIMULATION TOOLS
-    # =========================================================================
-
-    elif name == "launch_simulation":
-        # Launch Vivado's integrated simulator (xsim)
-        mode = arguments.get("mode", "behavioral")
-
-        # Map friendly names to Vivado's mode strings
-        mode_map = {
-            "behavioral": "behav",                    # RTL simulation
-            "post_synth_func": "synth -type func",   # Post-synthesis functional
-            "post_synth_timing": "synth -type timing", # Post-synthesis with timing
-            "post_impl_func": "impl -type func",     # Post-implementation functional
-            "post_impl_timing": "impl -type timing"  # Post-implementation with timing
-        }
-        sim_mode = mode_map.get(mode, "behav")
-        result = session.run_tcl(f"launch_simulation -mode {sim_mode}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "message": result.output if result.output else f"Simulation launched in {mode} mode",
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "run_simulation":
-        # Advance simulation time
-        time_val = arguments.get("time", "100ns")
-        if time_val.lower() == "all":
-            # Run until all events processed (testbench completes)
-            result = session.run_tcl("run -all")
-        else:
-            result = session.run_tcl(f"run {time_val}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "output": result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
 
-    elif name == "restart_simulation":
-        # Reset simulation to time 0
-        result = session.run_tcl("restart")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "message": "Simulation restarted" if result.success else result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
+# =============================================================================
+# TOOL HANDLERS: RAW TCL
+# =============================================================================
 
-    elif name == "close_simulation":
-        # Close the simulator
-        result = session.run_tcl("close_sim")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "message": "Simulation closed" if result.success else result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
+def _handle_run_tcl(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Execute arbitrary TCL command (escape hatch for advanced users)."""
+    command = arguments.get("command", "")
+    result = session.run_tcl(command)
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "output": result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
 
-    elif name == "get_simulation_time":
-        # Get current simulation time
-        result = session.run_tcl("current_time")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "time": result.output.strip() if result.success else None,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "get_signal_value":
-        # Get current value of a single signal
-        signal = arguments.get("signal", "")
-        radix = arguments.get("radix", "hex")
-        result = session.run_tcl(f"get_value -radix {radix} {{{signal}}}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "signal": signal,
-            "value": result.output.strip() if result.success else None,
-            "radix": radix,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
 
-    elif name == "get_signal_values":
-        # Get values of multiple signals matching a pattern
-        pattern = arguments.get("pattern", "/*")
-        radix = arguments.get("radix", "hex")
+# =============================================================================
+# TOOL HANDLERS: SIMULATION
+# =============================================================================
 
+def _handle_launch_simulation(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Launch Vivado's integrated simulator (xsim)."""
+    mode = arguments.get("mode", "behavioral")
+
+    # Map friendly names to Vivado's mode strings
+    mode_map = {
+        "behavioral": "behav",                    # RTL simulation
+        "post_synth_func": "synth -type func",   # Post-synthesis functional
+        "post_synth_timing": "synth -type timing", # Post-synthesis with timing
+        "post_impl_func": "impl -type func",     # Post-implementation functional
+        "post_impl_timing": "impl -type timing"  # Post-implementation with timing
+    }
+    sim_mode = mode_map.get(mode, "behav")
+    result = session.run_tcl(f"launch_simulation -mode {sim_mode}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "message": result.output if result.output else f"Simulation launched in {mode} mode",
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_run_simulation(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Advance simulation time."""
+    time_val = arguments.get("time", "100ns")
+    if time_val.lower() == "all":
+        # Run until all events processed (testbench completes)
+        result = session.run_tcl("run -all")
+    else:
+        result = session.run_tcl(f"run {time_val}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "output": result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_restart_simulation(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Reset simulation to time 0."""
+    result = session.run_tcl("restart")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "message": "Simulation restarted" if result.success else result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_close_simulation(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Close the simulator."""
+    result = session.run_tcl("close_sim")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "message": "Simulation closed" if result.success else result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_get_simulation_time(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get current simulation time."""
+    result = session.run_tcl("current_time")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "time": result.output.strip() if result.success else None,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_get_signal_value(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get current value of a single signal."""
+    signal = arguments.get("signal", "")
+    radix = arguments.get("radix", "hex")
+    result = session.run_tcl(f"get_value -radix {radix} {tcl_brace(signal)}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "signal": signal,
+        "value": result.output.strip() if result.success else None,
+        "radix": radix,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_get_signal_values(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get values of multiple signals matching a pattern."""
+    pattern = arguments.get("pattern", "/*")
+    radix = arguments.get("radix", "hex")
+
+    # A literal path (no wildcards) names at most one signal, so read it
+    # directly instead of first expanding the pattern with get_objects
+    literal = not any(c in pattern for c in "*?[")
+    if literal:
+        signals = [pattern]
+        elapsed_ms = 0.0
+    else:
         # First get list of signals matching pattern
-        signals_result = session.run_tcl(f"get_objects -filter {{TYPE == signal || TYPE == port}} {{{pattern}}}")
-        if signals_result.success and signals_result.output.strip():
-            signals = signals_result.output.strip().split()
-            values = {}
-            # Limit to 50 signals to avoid overwhelming response
-            for sig in signals[:50]:
-                val_result = session.run_tcl(f"get_value -radix {radix} {{{sig}}}")
-                if val_result.success:
-                    values[sig] = val_result.output.strip()
-            return [TextContent(type="text", text=json.dumps({
+        signals_result = session.run_tcl(f"get_objects -filter {{TYPE == signal || TYPE == port}} {tcl_brace(pattern)}")
+        elapsed_ms = signals_result.elapsed_ms
+        signals = signals_result.output.strip().split() if signals_result.success else []
+
+    if signals:
+        values = {}
+        # Limit to 50 signals to avoid overwhelming response
+        # Read all values in one foreach, one "<signal>\t<value>" line each
+        sample_signals = signals[:50]
+        signal_list = " ".join(tcl_brace(sig) for sig in sample_signals)
+        val_result = session.run_tcl(
+            f"foreach s [list {signal_list}] "
+            f"{{catch {{puts \"$s\\t[get_value -radix {radix} $s]\"}}}}"
+        )
+        for line in val_result.output.split("\n"):
+            sig, sep, value = line.partition("\t")
+            if sep and sig in sample_signals:
+                values[sig] = value.strip()
+        elapsed_ms += val_result.elapsed_ms
+        # get_value fails for a literal path that doesn't exist
+        if values or not literal:
+            return [TextContent(type="text", text=dumps_json({
                 "success": True,
                 "values": values,
                 "radix": radix,
-                "elapsed_ms": signals_result.elapsed_ms
-            }, indent=2))]
-        return [TextContent(type="text", text=json.dumps({
-            "success": False,
-            "error": "No signals found matching pattern",
-            "elapsed_ms": signals_result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "add_signals_to_wave":
-        # Add signals to waveform viewer
-        signals = arguments.get("signals", [])
-        if isinstance(signals, str):
-            signals = [signals]
-        results = []
-        for sig in signals:
-            result = session.run_tcl(f"add_wave {{{sig}}}")
-            results.append({"signal": sig, "success": result.success})
-        return [TextContent(type="text", text=json.dumps({
-            "success": all(r["success"] for r in results),
-            "results": results
-        }, indent=2))]
-
-    elif name == "set_simulation_top":
-        # Set the top-level testbench module
-        top_module = arguments.get("top_module", "")
-        fileset = arguments.get("fileset", "sim_1")
-        result = session.run_tcl(f"set_property top {top_module} [get_filesets {fileset}]")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "message": f"Set simulation top to {top_module}" if result.success else result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "get_simulation_objects":
-        # List simulation objects (signals, ports, variables) in a scope
-        scope = arguments.get("scope", "/")
-        obj_filter = arguments.get("filter", "all")
-
-        # Map filter names to Vivado filter expressions
-        filter_map = {
-            "all": "",
-            "signals": "-filter {TYPE == signal}",
-            "ports": "-filter {TYPE == port}",
-            "internal": "-filter {TYPE == signal && IS_PORT == false}"
-        }
-        filter_str = filter_map.get(obj_filter, "")
-        result = session.run_tcl(f"get_objects {filter_str} {{{scope}/*}}")
-        objects = result.output.strip().split() if result.success and result.output.strip() else []
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "scope": scope,
-            "objects": objects,
-            "count": len(objects),
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "get_scopes":
-        # List child scopes (hierarchy levels) in simulation
-        parent = arguments.get("parent", "/")
-        result = session.run_tcl(f"get_scopes {{{parent}/*}}")
-        scopes = result.output.strip().split() if result.success and result.output.strip() else []
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "parent": parent,
-            "scopes": scopes,
-            "count": len(scopes),
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
+                "elapsed_ms": elapsed_ms
+            }))]
+    return [TextContent(type="text", text=dumps_json({
+        "success": False,
+        "error": "No signals found matching pattern",
+        "elapsed_ms": elapsed_ms
+    }))]
+
+
+def _handle_add_signals_to_wave(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Add signals to waveform viewer."""
+    signals = arguments.get("signals", [])
+    if isinstance(signals, str):
+        signals = [signals]
+    # Add all signals in one round-trip; catch each add_wave so one bad
+    # signal doesn't stop the rest, and print "<signal>\t<code>" per signal
+    added = {}
+    if signals:
+        signal_list = " ".join(tcl_brace(sig) for sig in signals)
+        result = session.run_tcl(
+            f"foreach s [list {signal_list}] "
+            f"{{puts \"$s\\t[catch {{add_wave $s}}]\"}}"
+        )
+        for line in result.output.split("\n"):
+            sig, sep, code = line.partition("\t")
+            if sep:
+                added[sig] = code.strip() == "0"
+    results = [{"signal": sig, "success": added.get(sig, False)} for sig in signals]
+    return [TextContent(type="text", text=dumps_json({
+        "success": all(r["success"] for r in results),
+        "results": results
+    }))]
+
+
+def _handle_set_simulation_top(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Set the top-level testbench module."""
+    top_module = arguments.get("top_module", "")
+    fileset = arguments.get("fileset", "sim_1")
+    result = session.run_tcl(f"set_property top {top_module} [get_filesets {fileset}]")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "message": f"Set simulation top to {top_module}" if result.success else result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_get_simulation_objects(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """List simulation objects (signals, ports, variables) in a scope."""
+    scope = arguments.get("scope", "/")
+    obj_filter = arguments.get("filter", "all")
+
+    # Map filter names to Vivado filter expressions
+    filter_map = {
+        "all": "",
+        "signals": "-filter {TYPE == signal}",
+        "ports": "-filter {TYPE == port}",
+        "internal": "-filter {TYPE == signal && IS_PORT == false}"
+    }
+    filter_str = filter_map.get(obj_filter, "")
+    result = session.run_tcl(f"get_objects {filter_str} {tcl_brace(scope + '/*')}")
+    objects = result.output.strip().split() if result.success and result.output.strip() else []
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "scope": scope,
+        "objects": objects,
+        "count": len(objects),
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_get_scopes(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """List child scopes (hierarchy levels) in simulation."""
+    parent = arguments.get("parent", "/")
+    result = session.run_tcl(f"get_scopes {tcl_brace(parent + '/*')}")
+    scopes = result.output.strip().split() if result.success and result.output.strip() else []
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "parent": parent,
+        "scopes": scopes,
+        "count": len(scopes),
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_step_simulation(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Step simulation by delta cycles."""
+    count = arguments.get("count", 1)
+    result = session.run_tcl(f"step {count}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "output": result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_add_breakpoint(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Add a breakpoint on signal edge or change."""
+    signal = arguments.get("signal", "")
+    condition = arguments.get("condition", "change")
+
+    # Map condition names to Vivado flags
+    cond_map = {
+        "posedge": "-posedge",  # Rising edge
+        "negedge": "-negedge",  # Falling edge
+        "change": ""           # Any change
+    }
+    cond_str = cond_map.get(condition, "")
+    result = session.run_tcl(f"add_bp {cond_str} {tcl_brace(signal)}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "signal": signal,
+        "condition": condition,
+        "message": result.output if result.output else f"Breakpoint added on {signal}",
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_remove_breakpoints(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Remove all breakpoints."""
+    result = session.run_tcl("remove_bps -all")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "message": "All breakpoints removed" if result.success else result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
+
+
+def _handle_get_simulation_messages(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Get simulation log messages."""
+    severity = arguments.get("severity", "all")
+    if severity == "all":
+        result = session.run_tcl("get_msg_config -count")
+    else:
+        result = session.run_tcl(f"get_msg_config -count -severity {tcl_brace(severity)}")
+    return [TextContent(type="text", text=dumps_json({
+        "success": result.success,
+        "messages": result.output,
+        "elapsed_ms": result.elapsed_ms
+    }))]
 
-    elif name == "step_simulation":
-        # Step simulation by delta cycles
-        count = arguments.get("count", 1)
-        result = session.run_tcl(f"step {count}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "output": result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    elif name == "add_breakpoint":
-        # Add a breakpoint on signal edge or change
-        signal = arguments.get("signal", "")
-        condition = arguments.get("condition", "change")
-
-        # Map condition names to Vivado flags
-        cond_map = {
-            "posedge": "-posedge",  # Rising edge
-            "negedge": "-negedge",  # Falling edge
-            "change": ""           # Any change
-        }
-        cond_str = cond_map.get(condition, "")
-        result = session.run_tcl(f"add_bp {cond_str} {{{signal}}}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "signal": signal,
-            "condition": condition,
-            "message": result.output if result.output else f"Breakpoint added on {signal}",
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
 
-    elif name == "remove_breakpoints":
-        # Remove all breakpoints
-        result = session.run_tcl("remove_bps -all")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "message": "All breakpoints removed" if result.success else result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
+# =============================================================================
+# TOOL HANDLERS: FEATURE REQUESTS
+# =============================================================================
 
-    elif name == "get_simulation_messages":
-        # Get simulation log messages
-        severity = arguments.get("severity", "all")
-        if severity == "all":
-            result = session.run_tcl("get_msg_config -count")
-        else:
-            result = session.run_tcl(f"get_msg_config -count -severity {{{severity}}}")
-        return [TextContent(type="text", text=json.dumps({
-            "success": result.success,
-            "messages": result.output,
-            "elapsed_ms": result.elapsed_ms
-        }, indent=2))]
-
-    # =========================================================================
-    # FEATURE REQUESTS
-    # =========================================================================
-
-    elif name == "request_feature":
-        # Submit a feature request for future development
-        title = arguments.get("title", "")
-        description = arguments.get("description", "")
-        use_case = arguments.get("use_case", "")
-        priority = arguments.get("priority", "medium")
-
-        request = {
-            "id": len(load_feature_requests()) + 1,
-            "title": title,
-            "description": description,
-            "use_case": use_case,
-            "priority": priority,
-            "timestamp": datetime.now().isoformat(),
-            "status": "pending"
-        }
-        save_feature_request(request)
+def _handle_request_feature(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Submit a feature request for future development."""
+    title = arguments.get("title", "")
+    description = arguments.get("description", "")
+    use_case = arguments.get("use_case", "")
+    priority = arguments.get("priority", "medium")
+
+    request = {
+        "id": next_feature_request_id(),
+        "title": title,
+        "description": description,
+        "use_case": use_case,
+        "priority": priority,
+        "timestamp": datetime.now().isoformat(),
+        "status": "pending"
+    }
+    save_feature_request(request)
 
-        return [TextContent(type="text", text=json.dumps({
-            "success": True,
-            "message": f"Feature request #{request['id']} submitted: {title}",
-            "request": request
-        }, indent=2))]
-
-    elif name == "list_feature_requests":
-        # List all submitted feature requests
-        requests = load_feature_requests()
-        return [TextContent(type="text", text=json.dumps({
-            "success": True,
-            "total": len(requests),
-            "requests": requests
-        }, indent=2))]
-
-    # =========================================================================
-    # REPORT FILE MANAGEMENT
-    # =========================================================================
-
-    elif name == "generate_full_report":
-        # Generate a complete report to a file (for large reports)
-        report_type = arguments.get("report_type", "timing")
-        options = arguments.get("options", {})
-        output_file = arguments.get("output_file")
-
-        # Ensure reports directory exists and clean up old files
-        ensure_reports_dir()
-
-        # Generate unique report ID and file path
-        report_id = generate_report_id()
-        if output_file:
-            file_path = Path(output_file)
-        else:
-            file_path = REPORTS_DIR / f"{report_type}_{report_id}.txt"
-
-        # Map report types to Vivado commands
-        report_commands = {
-            "timing": "report_timing -max_paths 100",
-            "timing_summary": "report_timing_summary",
-            "utilization": "report_utilization",
-            "hierarchy": "report_hierarchy",
-            "clocks": "report_clocks",
-            "power": "report_power",
-            "drc": "report_drc"  # Design Rule Check
-        }
+    return [TextContent(type="text", text=dumps_json({
+        "success": True,
+        "message": f"Feature request #{request['id']} submitted: {title}",
+        "request": request
+    }))]
 
-        base_cmd = report_commands.get(report_type, f"report_{report_type}")
 
-        # Apply report-specific options
-        if report_type == "utilization" and options.get("hierarchical"):
-            base_cmd += " -hierarchical"
-        if report_type == "timing" and options.get("num_paths"):
-            base_cmd = base_cmd.replace("-max_paths 100", f"-max_paths {options['num_paths']}")
+def _handle_list_feature_requests(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """List all submitted feature requests."""
+    requests = load_feature_requests()
+    return [TextContent(type="text", text=dumps_json({
+        "success": True,
+        "total": len(requests),
+        "requests": requests
+    }))]
 
-        # Write directly to file using Vivado's -file option
-        cmd = f"{base_cmd} -file {{{file_path}}}"
-        result = session.run_tcl(cmd)
 
-        if result.success:
-            try:
-                # Get file statistics
-                file_stat = file_path.stat()
-                line_count = sum(1 for _ in open(file_path))
-
-                # Cache report metadata for later lookup
-                _report_cache[report_id] = {
-                    "file_path": str(file_path),
-                    "report_type": report_type,
-                    "created": datetime.now().isoformat(),
-                    "size_bytes": file_stat.st_size,
-                    "line_count": line_count
-                }
-
-                return [TextContent(type="text", text=json.dumps({
-                    "success": True,
-                    "report_id": report_id,
-                    "file_path": str(file_path),
-                    "report_type": report_type,
-                    "size_bytes": file_stat.st_size,
-                    "line_count": line_count,
-                    "message": f"Report written to {file_path}. Use read_report_section to read portions.",
-                    "elapsed_ms": result.elapsed_ms
-                }, indent=2))]
-            except (OSError, IOError) as e:
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": f"Report generated but could not read file info: {e}",
-                    "file_path": str(file_path),
-                    "elapsed_ms": result.elapsed_ms
-                }, indent=2))]
-        else:
-            return [TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": result.output,
+# =============================================================================
+# TOOL HANDLERS: REPORT FILE MANAGEMENT
+# =============================================================================
+
+def _handle_generate_full_report(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Generate a complete report to a file (for large reports)."""
+    report_type = arguments.get("report_type", "timing")
+    options = arguments.get("options", {})
+    output_file = arguments.get("output_file")
+
+    # Ensure reports directory exists and clean up old files
+    ensure_reports_dir()
+
+    # Generate unique report ID and file path
+    report_id = generate_report_id()
+    if output_file:
+        file_path = Path(output_file)
+    else:
+        file_path = REPORTS_DIR / f"{report_type}_{report_id}.txt"
+
+    # Map report types to Vivado commands
+    report_commands = {
+        "timing": "report_timing -max_paths 100",
+        "timing_summary": "report_timing_summary",
+        "utilization": "report_utilization",
+        "hierarchy": "report_hierarchy",
+        "clocks": "report_clocks",
+        "power": "report_power",
+        "drc": "report_drc"  # Design Rule Check
+    }
+
+    base_cmd = report_commands.get(report_type, f"report_{report_type}")
+
+    # Apply report-specific options
+    if report_type == "utilization" and options.get("hierarchical"):
+        base_cmd += " -hierarchical"
+    if report_type == "timing" and options.get("num_paths"):
+        base_cmd = base_cmd.replace("-max_paths 100", f"-max_paths {options['num_paths']}")
+
+    # Write directly to file using Vivado's -file option
+    cmd = f"{base_cmd} -file {tcl_brace(file_path)}"
+    result = session.run_tcl(cmd)
+
+    if result.success:
+        try:
+            # Get file statistics and line count from a single open:
+            # fstat on the open descriptor avoids a second path lookup
+            with open(file_path, 'rb') as f:
+                file_stat = os.fstat(f.fileno())
+                line_count = count_lines(f)
+
+            # Cache report metadata for later lookup
+            _report_cache[report_id] = {
+                "file_path": str(file_path),
+                "report_type": report_type,
+                "created": datetime.now().isoformat(),
+                "size_bytes": file_stat.st_size,
+                "mtime": file_stat.st_mtime,
+                "line_count": line_count
+            }
+
+            return [TextContent(type="text", text=dumps_json({
+                "success": True,
+                "report_id": report_id,
+                "file_path": str(file_path),
+                "report_type": report_type,
+                "size_bytes": file_stat.st_size,
+                "line_count": line_count,
+                "message": f"Report written to {file_path}. Use read_report_section to read portions.",
                 "elapsed_ms": result.elapsed_ms
-            }, indent=2))]
-
-    elif name == "read_report_section":
-        # Read a portion of a previously generated report
-        report_id = arguments.get("report_id")
-        file_path = arguments.get("file_path")
-        start_line = arguments.get("start_line", 1)
-        num_lines = arguments.get("num_lines", 100)
-        search_pattern = arguments.get("search_pattern")
-
-        # Resolve file path from report_id if provided
-        if report_id:
-            if report_id in _report_cache:
-                file_path = _report_cache[report_id]["file_path"]
-            else:
-                # Try to find file in reports directory by ID
-                possible_files = list(REPORTS_DIR.glob(f"*_{report_id}.txt"))
-                if possible_files:
-                    file_path = str(possible_files[0])
-                else:
-                    return [TextContent(type="text", text=json.dumps({
-                        "success": False,
-                        "error": f"Report ID '{report_id}' not found in cache or reports directory"
-                    }, indent=2))]
-
-        if not file_path:
-            return [TextContent(type="text", text=json.dumps({
+            }))]
+        except (OSError, IOError) as e:
+            return [TextContent(type="text", text=dumps_json({
                 "success": False,
-                "error": "Either report_id or file_path must be provided"
-            }, indent=2))]
+                "error": f"Report generated but could not read file info: {e}",
+                "file_path": str(file_path),
+                "elapsed_ms": result.elapsed_ms
+            }))]
+    else:
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "error": result.output,
+            "elapsed_ms": result.elapsed_ms
+        }))]
 
-        try:
-            file_path = Path(file_path)
-            if not file_path.exists():
-                return [TextContent(type="text", text=json.dumps({
-                    "success": False,
-                    "error": f"File not found: {file_path}"
-                }, indent=2))]
 
-            # Read all lines from file
-            with open(file_path, 'r') as f:
-                all_lines = f.readlines()
+def _handle_read_report_section(session: VivadoSession, arguments: dict) -> list[TextContent]:
+    """Read a portion of a previously generated report."""
+    report_id = arguments.get("report_id")
+    file_path = arguments.get("file_path")
+    start_line = arguments.get("start_line", 1)
+    num_lines = arguments.get("num_lines", 100)
+    search_pattern = arguments.get("search_pattern")
 
-            total_lines = len(all_lines)
+    # Resolve file path from report_id if provided
+    if report_id:
+        if report_id in _report_cache:
+            file_path = _report_cache[report_id]["file_path"]
+        else:
+            # Try to find file in reports directory by ID
+            possible_files = list(REPORTS_DIR.glob(f"*_{report_id}.txt"))
+            if possible_files:
+                file_path = str(possible_files[0])
+            else:
+                return [TextContent(type="text", text=dumps_json({
+                    "success": False,
+                    "error": f"Report ID '{report_id}' not found in cache or reports directory"
+                }))]
 
-            # Handle search pattern - find and return context around match
+    if not file_path:
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "error": "Either report_id or file_path must be provided"
+        }))]
+
+    try:
+        file_path = Path(file_path)
+        if not file_path.exists():
+            return [TextContent(type="text", text=dumps_json({
+                "success": False,
+                "error": f"File not found: {file_path}"
+            }))]
+
+        # Reuse the line count from generate_full_report unless the file
+        # has been modified since it was counted
+        cached = _report_cache.get(report_id) if report_id else None
+        mtime = file_path.stat().st_mtime
+        known_total = None
+        if cached is not None:
+            if cached.get("mtime") == mtime:
+                known_total = cached["line_count"]
+            else:
+                cached.pop("search_index", None)
+
+        # Repeat searches of an unchanged report jump straight to the
+        # previously found match instead of scanning again
+        search_index = cached.setdefault("search_index", {}) if cached is not None else {}
+        if search_pattern and search_pattern in search_index:
+            match_idx = search_index[search_pattern]
+            selected_lines, start_idx, total_lines = [], 0, known_total
+            if match_idx is not None:
+                selected_lines, start_idx, total_lines, _ = read_report_lines(
+                    file_path, max(0, match_idx - num_lines // 4) + 1, num_lines,
+                    total_lines=known_total
+                )
+        else:
+            # Stream just the requested window (or the window around the
+            # first search match) instead of reading the whole file
+            selected_lines, start_idx, total_lines, match_idx = read_report_lines(
+                file_path, start_line, num_lines, search_pattern, known_total
+            )
             if search_pattern:
-                pattern = re.compile(search_pattern, re.IGNORECASE)
-                for i, line in enumerate(all_lines):
-                    if pattern.search(line):
-                        # Found match, return context around it
-                        context_before = num_lines // 4
-                        context_after = num_lines - context_before
-                        start_line = max(1, i + 1 - context_before)
-                        break
-                else:
-                    return [TextContent(type="text", text=json.dumps({
-                        "success": True,
-                        "warning": f"Pattern '{search_pattern}' not found in file",
-                        "total_lines": total_lines,
-                        "file_path": str(file_path)
-                    }, indent=2))]
-
-            # Extract requested line range (1-indexed to 0-indexed)
-            start_idx = max(0, start_line - 1)
-            end_idx = min(total_lines, start_idx + num_lines)
-            selected_lines = all_lines[start_idx:end_idx]
-
-            content = ''.join(selected_lines)
-
-            return [TextContent(type="text", text=json.dumps({
+                search_index[search_pattern] = match_idx
+
+        # Refresh a stale cache entry with the count we just took
+        if cached is not None and known_total is None:
+            cached["line_count"] = total_lines
+            cached["mtime"] = mtime
+        if search_pattern and match_idx is None:
+            return [TextContent(type="text", text=dumps_json({
                 "success": True,
-                "file_path": str(file_path),
-                "start_line": start_idx + 1,
-                "end_line": end_idx,
+                "warning": f"Pattern '{search_pattern}' not found in file",
                 "total_lines": total_lines,
-                "returned_lines": len(selected_lines),
-                "content": content
-            }, indent=2))]
+                "file_path": str(file_path)
+            }))]
 
-        except (OSError, IOError) as e:
-            return [TextContent(type="text", text=json.dumps({
-                "success": False,
-                "error": f"Error reading file: {e}"
-            }, indent=2))]
+        end_idx = start_idx + len(selected_lines)
+        content = ''.join(selected_lines)
 
-    # =========================================================================
-    # UNKNOWN TOOL
-    # =========================================================================
+        return [TextContent(type="text", text=dumps_json({
+            "success": True,
+            "file_path": str(file_path),
+            "start_line": start_idx + 1,
+            "end_line": end_idx,
+            "total_lines": total_lines,
+            "returned_lines": len(selected_lines),
+            "content": content
+        }))]
+
+    except (OSError, IOError) as e:
+        return [TextContent(type="text", text=dumps_json({
+            "success": False,
+            "error": f"Error reading file: {e}"
+        }))]
+
+
+# =============================================================================
+# TOOL DISPATCH TABLE
+# =============================================================================
 
-    return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}, indent=2))]
+# Tools that work without a running Vivado session. Every other tool gets a
+# "session not running" error before its handler is called.
+_SESSIONLESS_TOOLS = frozenset({
+    "start_session",
+    "stop_session",
+    "session_status",
+    "check_session_health",
+    "get_host_status",
+})
+
+# Tools that never touch Vivado, so they don't take a "project" argument
+_PROJECTLESS_TOOLS = frozenset({
+    "get_host_status",
+    "request_feature",
+    "list_feature_requests",
+})
+
+# Maps tool name -> handler. Built once at import so each call is a single
+# dict lookup instead of a walk down an if/elif chain.
+_DISPATCH = {
+    # Session management
+    "start_session": _handle_start_session,
+    "stop_session": _handle_stop_session,
+    "session_status": _handle_session_status,
+    "check_session_health": _handle_check_session_health,
+    "get_host_status": _handle_get_host_status,
+
+    # Project management
+    "open_project": _handle_open_project,
+    "close_project": _handle_close_project,
+    "get_project_info": _handle_get_project_info,
+
+    # Design flow
+    "run_synthesis": _handle_run_synthesis,
+    "parallel_synth_explore": _handle_parallel_synth_explore,
+    "run_implementation": _handle_run_implementation,
+    "generate_bitstream": _handle_generate_bitstream,
+
+    # Reports and analysis
+    "get_timing_summary": _handle_get_timing_summary,
+    "get_timing_paths": _handle_get_timing_paths,
+    "get_utilization": _handle_get_utilization,
+    "get_clocks": _handle_get_clocks,
+    "get_messages": _handle_get_messages,
+
+    # Design queries
+    "get_design_hierarchy": _handle_get_design_hierarchy,
+    "get_ports": _handle_get_ports,
+    "get_nets": _handle_get_nets,
+    "get_cells": _handle_get_cells,
+
+    # Raw TCL
+    "run_tcl": _handle_run_tcl,
+
+    # Simulation
+    "launch_simulation": _handle_launch_simulation,
+    "run_simulation": _handle_run_simulation,
+    "restart_simulation": _handle_restart_simulation,
+    "close_simulation": _handle_close_simulation,
+    "get_simulation_time": _handle_get_simulation_time,
+    "get_signal_value": _handle_get_signal_value,
+    "get_signal_values": _handle_get_signal_values,
+    "add_signals_to_wave": _handle_add_signals_to_wave,
+    "set_simulation_top": _handle_set_simulation_top,
+    "get_simulation_objects": _handle_get_simulation_objects,
+    "get_scopes": _handle_get_scopes,
+    "step_simulation": _handle_step_simulation,
+    "add_breakpoint": _handle_add_breakpoint,
+    "remove_breakpoints": _handle_remove_breakpoints,
+    "get_simulation_messages": _handle_get_simulation_messages,
+
+    # Feature requests
+    "request_feature": _handle_request_feature,
+    "list_feature_requests": _handle_list_feature_requests,
+
+    # Report file management
+    "generate_full_report": _handle_generate_full_report,
+    "read_report_section": _handle_read_report_section,
+}
 
 
 # =============================================================================
@@ -2271,5 +3070,4 @@ async def main():
 
 # Allow running directly with: python server.py
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
@@ -0,0 +1,78 @@
+"""
+Tests for get_design_hierarchy's reuse of a cached "get_cells -hierarchical *".
+
+A stand-in session answers the few TCL commands the handler sends, so no
+Vivado installation is needed.
+"""
+
+import json
+import unittest
+from collections import OrderedDict
+
+from vivado_mcp.server import _handle_get_design_hierarchy
+from vivado_mcp.vivado_session import CommandResult
+
+
+# Every hierarchical cell, in Vivado's order, and what
+# "get_cells -hierarchical <pattern>" returns for the patterns used below
+ALL_CELLS = ["core", "core/alu", "core/alu/adder", "core/regs", "io"]
+GET_CELLS = {
+    "*": ALL_CELLS,
+    "core/*": ["core/alu", "core/regs"],
+    "core/alu/*": ["core/alu/adder"],
+}
+
+
+class FakeSession:
+    """Minimal VivadoSession stand-in with a real design query cache."""
+
+    def __init__(self):
+        self.current_project = "/tmp/proj.xpr"
+        self.commands = []
+        self._design_cache = OrderedDict()
+
+    def run_tcl(self, command: str, **kwargs) -> CommandResult:
+        self.commands.append(command)
+        if command.startswith("current_design"):
+            output = "synth_1"
+        elif command.startswith("get_cells -hierarchical "):
+            pattern = command[len("get_cells -hierarchical "):].strip("{}")
+            output = " ".join(GET_CELLS[pattern])
+        else:
+            output = ""
+        return CommandResult(command=command, output=output, return_value="0",
+                             success=True, elapsed_ms=0.0)
+
+    def get_cached_design_query(self, key: tuple):
+        return self._design_cache.get(key)
+
+    def cache_design_query(self, key: tuple, result: dict) -> None:
+        self._design_cache[key] = result
+
+
+def get_hierarchy(session: FakeSession, pattern: str) -> dict:
+    """Run the tool handler and decode its JSON response."""
+    response = _handle_get_design_hierarchy(session, {"instance_pattern": pattern})
+    return json.loads(response[0].text)
+
+
+class CachedHierarchyTest(unittest.TestCase):
+    def test_parent_pattern_after_star_is_not_empty(self):
+        session = FakeSession()
+        self.assertEqual(get_hierarchy(session, "*")["cells"], ALL_CELLS)
+
+        # Drill down: patterns with "/" must still find the cells
+        self.assertEqual(get_hierarchy(session, "core/*")["cells"], ["core/alu", "core/regs"])
+        self.assertEqual(get_hierarchy(session, "core/alu/*")["cells"], ["core/alu/adder"])
+
+    def test_local_pattern_after_star_uses_cache(self):
+        session = FakeSession()
+        get_hierarchy(session, "*")
+        session.commands.clear()
+
+        self.assertEqual(get_hierarchy(session, "a*")["cells"], ["core/alu", "core/alu/adder"])
+        self.assertFalse(any(c.startswith("get_cells -hierarchical") for c in session.commands))
+
+
+if __name__ == "__main__":
+    unittest.main()
